@@ -1,13 +1,63 @@
 """
 Registry API client for CLI to register and query projects
 """
+import base64
+import functools
+import hashlib
+import json
 import os
+import threading
+import time
 import requests
-from typing import Dict, List, Optional
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional, Tuple
 from rich.console import Console
+from urllib3.util.retry import Retry
+
+from solvigo.utils import fastjson
+from solvigo.utils.cache_dir import CACHE_DIR
 
 console = Console()
 
+# Identity tokens and platform config are cached per API URL in CACHE_DIR so separate CLI runs can reuse them
+TOKEN_EXPIRY_MARGIN = 60  # Refresh tokens this many seconds before they expire
+PLATFORM_CONFIG_TTL = 300
+CLIENT_LIST_TTL = 3600
+
+# Identity tokens shared by every AdminClient in the process: api_url -> (token, exp)
+_TOKEN_CACHE: Dict[str, Tuple[str, float]] = {}
+_TOKEN_LOCK = threading.Lock()
+
+# Read-only GET responses, reused for the rest of the CLI run and cleared by any write
+_response_cache: Dict[tuple, object] = {}
+
+# Shared header dicts for unauthenticated requests (never mutated)
+_NO_HEADERS: Dict[str, str] = {}
+_JSON_HEADERS: Dict[str, str] = {'Content-Type': 'application/json'}
+
+
+def _decode_token_expiry(token: str) -> float:
+    """Read the `exp` claim from a JWT without verifying it (0 if unreadable)"""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))['exp'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return 0
+
+
+def _write_cache_file(path: Path, payload: Dict):
+    """Write a cache file readable by the current user only (best-effort)"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(payload, f)
+    except OSError:
+        # Caching is best-effort - the data is fetched again next time
+        pass
+
 
 class AdminClient:
     """Client for interacting with Solvigo Admin API"""
@@ -22,77 +72,185 @@ class AdminClient:
                 'https://admin-api-430162142300.europe-north1.run.app'
             )
         self.base_url = f"{self.api_url}/api/v1"
-        self._token = None
+        self._url_fmt = self.base_url + '/%s'
+        self._auth_headers = _JSON_HEADERS
+        self._auth_headers_token = None
+
+        # Reuse one session so sequential calls share keep-alive connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False  # Let raise_for_status() report the final response
+            )
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    def _cache_path(self, name: str) -> Path:
+        """Path of an on-disk cache file for this API URL"""
+        digest = hashlib.sha1(self.api_url.encode()).hexdigest()
+        return CACHE_DIR / f'{name}_{digest}.json'
+
+    def _read_cached_token(self) -> Optional[Tuple[str, float]]:
+        """Load a still-valid (token, exp) pair from the on-disk cache"""
+        try:
+            cached = json.loads(self._cache_path('id_token').read_text())
+            token, exp = cached['token'], float(cached['exp'])
+        except (OSError, KeyError, TypeError, ValueError):
+            return None
+
+        if exp - time.time() <= TOKEN_EXPIRY_MARGIN:
+            return None
+
+        return token, exp
+
+    def _fetch_identity_token(self) -> str:
+        """Mint a new ID token, preferring google-auth over a gcloud subprocess"""
+        try:
+            from google.auth.exceptions import GoogleAuthError
+            from google.auth.transport.requests import Request
+            from google.oauth2 import id_token
+        except ImportError:
+            return self._fetch_identity_token_gcloud()
+
+        try:
+            return id_token.fetch_id_token(Request(session=self._session), self.api_url)
+        except GoogleAuthError:
+            # User credentials from `gcloud auth login` can't mint ID tokens via ADC
+            return self._fetch_identity_token_gcloud()
+
+    def _fetch_identity_token_gcloud(self) -> str:
+        """Mint a new ID token with `gcloud auth print-identity-token`"""
+        import subprocess
+        result = subprocess.run(
+            [
+                'gcloud', 'auth', 'print-identity-token',
+                f'--audiences={self.api_url}'
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=10
+        )
+        return result.stdout.strip()
 
     def _get_auth_token(self) -> Optional[str]:
         """Get GCP ID token for authenticating to Cloud Run"""
         # Auth is now required in all modes (dev and prod)
-        if self._token:
-            return self._token
+        # The lock also keeps concurrent batch requests from each minting a token
+        with _TOKEN_LOCK:
+            cached = _TOKEN_CACHE.get(self.api_url)
+            if cached and (not cached[1] or cached[1] - time.time() > TOKEN_EXPIRY_MARGIN):
+                return cached[0]
+
+            cached = self._read_cached_token()
+            if not cached:
+                try:
+                    token = self._fetch_identity_token()
+                except Exception as e:
+                    raise Exception(f"Failed to get auth token: {e}")
+
+                cached = (token, _decode_token_expiry(token))
+                if cached[1]:
+                    _write_cache_file(self._cache_path('id_token'), {'token': token, 'exp': cached[1]})
+
+            _TOKEN_CACHE[self.api_url] = cached
+            return cached[0]
+
+    def _get_auth_headers(self) -> Dict[str, str]:
+        """Headers for authenticated requests, rebuilt only when the token changes"""
+        # In dev mode, we still need auth but the API doesn't validate the token
+        # We still send it for consistency with the API endpoint requirements
+        if not self.dev_mode:
+            token = self._get_auth_token()
+        else:
+            # In dev mode, send a dummy token (API should not validate it strictly)
+            token = 'dev-mode-token'
 
-        try:
-            import subprocess
-            result = subprocess.run(
-                [
-                    'gcloud', 'auth', 'print-identity-token',
-                    f'--audiences={self.api_url}'
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=10
-            )
-            self._token = result.stdout.strip()
-            return self._token
-        except Exception as e:
-            raise Exception(f"Failed to get auth token: {e}")
+        if not token:
+            return _JSON_HEADERS
+
+        if token != self._auth_headers_token:
+            self._auth_headers = {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
+            self._auth_headers_token = token
+        return self._auth_headers
 
-    def _make_request(self, method: str, endpoint: str, data: Dict = None, require_auth: bool = True, timeout: int = 30) -> Dict:
+    def _make_request(self, method: str, endpoint: str, data: Dict = None, require_auth: bool = True,
+                      timeout: int = 30, params: Dict = None) -> Dict:
         """Make HTTP request to registry API"""
-        url = f"{self.base_url}/{endpoint}"
-        headers = {}
+        url = self._url_fmt % endpoint
+
+        if method != 'GET':
+            # Any write may change listings served from the cache
+            _response_cache.clear()
 
         if require_auth:
-            # In dev mode, we still need auth but the API doesn't validate the token
-            # We still send it for consistency with the API endpoint requirements
-            if not self.dev_mode:
-                token = self._get_auth_token()
-                if token:
-                    headers['Authorization'] = f'Bearer {token}'
-            else:
-                # In dev mode, send a dummy token (API should not validate it strictly)
-                headers['Authorization'] = 'Bearer dev-mode-token'
-
-        if data:
-            headers['Content-Type'] = 'application/json'
+            headers = self._get_auth_headers()
+        else:
+            headers = _JSON_HEADERS if data is not None else _NO_HEADERS
 
-        try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=timeout)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, timeout=timeout)
-            elif method == 'PATCH':
-                response = requests.patch(url, json=data, headers=headers, timeout=timeout)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=timeout)
-            else:
-                raise ValueError(f"Unsupported method: {method}")
+        body = fastjson.dumps(data) if data is not None else None
 
+        try:
+            response = self._session.request(
+                method, url, data=body, params=params, headers=headers, timeout=timeout
+            )
             response.raise_for_status()
 
             # DELETE requests may return 204 No Content
-            if response.status_code == 204 or not response.content:
+            if response.status_code == 204 or response.headers.get('Content-Length') == '0':
                 return {}
 
-            return response.json()
+            # Chunked responses carry no Content-Length, so the body can still be empty
+            content = response.content
+            return fastjson.loads(content) if content else {}
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 409:
                 # Resource already exists - return existing
-                return e.response.json()
-            raise Exception(f"HTTP {e.response.status_code}: {e.response.text}")
+                return fastjson.loads(e.response.content)
+            raise Exception(f"HTTP {e.response.status_code}: {e.response.text}") from e
         except Exception as e:
-            raise Exception(f"Request failed: {e}")
+            raise Exception(f"Request failed: {e}") from e
+
+    def _cached_get(self, endpoint: str, params: Dict = None, require_auth: bool = False) -> object:
+        """GET an endpoint, reusing the response for the rest of the CLI run"""
+        key = (self.base_url, endpoint, tuple(sorted((params or {}).items())))
+        if key not in _response_cache:
+            _response_cache[key] = self._make_request('GET', endpoint, params=params, require_auth=require_auth)
+        return _response_cache[key]
+
+    def _disk_cached_get(self, name: str, endpoint: str, ttl: int, require_auth: bool = False) -> object:
+        """GET an endpoint whose response is also shared across CLI runs for `ttl` seconds"""
+        key = (self.base_url, endpoint, ())
+        if key in _response_cache:
+            return _response_cache[key]
+
+        path = self._cache_path(name)
+        try:
+            cached = json.loads(path.read_text())
+            if time.time() - cached['fetched_at'] < ttl:
+                _response_cache[key] = cached['data']
+                return cached['data']
+        except (OSError, KeyError, TypeError, ValueError):
+            pass
+
+        data = self._make_request('GET', endpoint, require_auth=require_auth)
+        _write_cache_file(path, {'data': data, 'fetched_at': time.time()})
+        _response_cache[key] = data
+        return data
+
+    def _forget_disk_cache(self, name: str):
+        """Drop an on-disk cached response after a write that changes it"""
+        try:
+            self._cache_path(name).unlink(missing_ok=True)
+        except OSError:
+            pass
 
     # ===== Client Operations =====
 
@@ -114,22 +272,28 @@ class AdminClient:
                 'billing_contact': 'billing@acme.com'
             }
         """
+        self._forget_disk_cache('clients')
         return self._make_request('POST', 'clients', data=client_data, require_auth=True)
 
     def list_clients(self) -> List[Dict]:
-        """List all clients"""
-        return self._make_request('GET', 'clients', require_auth=False)
+        """List all clients (the client list rarely changes, so it is shared across CLI runs)"""
+        return self._disk_cached_get('clients', 'clients', CLIENT_LIST_TTL)
 
     def get_client(self, client_id: str) -> Dict:
-        """Get client details"""
+        """Get client details, served from an already-fetched client list when possible"""
+        for client in _response_cache.get((self.base_url, 'clients', ()), None) or []:
+            if client.get('id') == client_id:
+                return client
+
         return self._make_request('GET', f'clients/{client_id}', require_auth=False)
 
     def list_folders(self) -> List[Dict]:
         """List all available GCP folders under the parent folder"""
-        return self._make_request('GET', 'clients/folders/list', require_auth=False)
+        return self._cached_get('clients/folders/list')
 
     def update_client_folder(self, client_id: str, gcp_folder_id: str) -> Dict:
         """Update client's GCP folder"""
+        self._forget_disk_cache('clients')
         return self._make_request(
             'PATCH',
             f'clients/{client_id}/folder',
@@ -190,29 +354,44 @@ class AdminClient:
         """
         return self._make_request('POST', 'projects', data=project_data, require_auth=True)
 
+    def register_bulk(self, client_data: Dict, project_data: Dict) -> Dict:
+        """
+        Register a client and project together in one transaction.
+
+        Existing entities are left as they are, so this is safe to call for
+        a client that is already registered.
+
+        Args:
+            client_data: Client fields as for register_client()
+            project_data: Project fields as for register_project()
+
+        Returns:
+            Dict with 'client' and 'project' set to 'created' or 'exists', and 'project_id'
+        """
+        self._forget_disk_cache('clients')
+        return self._make_request(
+            'POST', 'projects/bulk',
+            data={'client': client_data, 'project': project_data},
+            require_auth=True
+        )
+
     def list_projects(self, client_id: Optional[str] = None, github_repo: Optional[str] = None) -> List[Dict]:
         """List all projects, optionally filtered by client or github_repo"""
-        params = []
-        if client_id:
-            params.append(f'client_id={client_id}')
-        if github_repo:
-            params.append(f'github_repo={github_repo}')
-
-        endpoint = 'projects'
-        if params:
-            endpoint += '?' + '&'.join(params)
+        params = {'client_id': client_id, 'github_repo': github_repo}
+        params = {key: value for key, value in params.items() if value}
 
-        return self._make_request('GET', endpoint, require_auth=False)
+        return self._cached_get('projects', params=params)
 
     def get_project(self, project_id: str) -> Dict:
-        """Get project details with environments and services"""
-        return self._make_request('GET', f'projects/{project_id}', require_auth=False)
+        """Get project details with environments and services (reused until the next write)"""
+        return self._cached_get(f'projects/{project_id}')
 
     def update_subdomain(self, project_id: str, new_subdomain: str) -> Dict:
         """Update project subdomain"""
         return self._make_request(
             'PATCH',
-            f'projects/{project_id}/subdomain?new_subdomain={new_subdomain}',
+            f'projects/{project_id}/subdomain',
+            params={'new_subdomain': new_subdomain},
             require_auth=True
         )
 
@@ -260,13 +439,17 @@ class AdminClient:
 
     def list_gcp_projects(self) -> List[Dict]:
         """
-        List all GCP projects accessible to the user.
+        List all active GCP projects accessible to the user.
 
         Returns:
             List of dicts with project_id, name, parent, project_number
         """
-        result = self._make_request('GET', 'projects/gcp/list', require_auth=False)
-        return result.get('projects', [])
+        result = self._cached_get('projects/gcp/list', params={'state': 'ACTIVE'})
+        # The API may ignore the filter, so drop inactive projects in the same pass
+        return [
+            project for project in result.get('projects', [])
+            if project.get('state', 'ACTIVE') == 'ACTIVE'
+        ]
 
     def check_gcp_project_exists(self, gcp_project_id: str) -> bool:
         """
@@ -277,6 +460,9 @@ class AdminClient:
 
         Returns:
             True if exists, False otherwise
+
+        Raises:
+            Exception if the check itself fails (anything other than a 404)
         """
         try:
             result = self._make_request(
@@ -284,10 +470,14 @@ class AdminClient:
                 f'projects/check-gcp-id/{gcp_project_id}',
                 require_auth=True
             )
-            return result.get('exists', False)
-        except Exception:
-            # If check fails, assume doesn't exist
-            return False
+        except Exception as e:
+            # Only a 404 means "doesn't exist" - timeouts and 5xx must not read as a free ID
+            cause = e.__cause__
+            if isinstance(cause, requests.exceptions.HTTPError) and cause.response.status_code == 404:
+                return False
+            raise
+
+        return result.get('exists', False)
 
     def setup_cicd(self, project_id: str, cicd_config: Dict) -> Dict:
         """
@@ -352,12 +542,8 @@ class AdminClient:
             - shared_registry_location: Shared Artifact Registry location
             - shared_registry_repo: Shared Artifact Registry repository
         """
-        return self._make_request(
-            'GET',
-            'platform/config',
-            require_auth=True,
-            timeout=30
-        )
+        # Platform config rarely changes, so it is also shared across CLI runs
+        return self._disk_cached_get('platform_config', 'platform/config', PLATFORM_CONFIG_TTL, require_auth=True)
 
     def delete_project(self, project_id: str) -> bool:
         """
@@ -442,39 +628,19 @@ class AdminClient:
             require_auth=True
         )
 
-    def create_build_triggers(self, project_id: str, trigger_config: Dict) -> Dict:
-        """
-        Create Cloud Build triggers in platform project.
 
-        Args:
-            project_id: Client project ID
-            trigger_config: Dict with github_repo_url and environments[]
+@functools.lru_cache(maxsize=4)
+def get_admin_client(dev_mode: bool = False) -> AdminClient:
+    """
+    Shared AdminClient for the current CLI run.
 
-        Returns:
-            Dict with created trigger IDs and names
+    Every caller gets the same instance per mode, so all Admin API calls in
+    a run reuse one connection pool and its keep-alive connections.
 
-        Example:
-            trigger_config = {
-                'github_repo_url': 'https://github.com/org/repo',
-                'environments': [
-                    {
-                        'name': 'staging',
-                        'branch_pattern': 'main',
-                        'cloudbuild_file': 'cicd/cloudbuild-backend.yaml',
-                        'require_approval': False
-                    },
-                    {
-                        'name': 'prod',
-                        'tag_pattern': 'v*',
-                        'cloudbuild_file': 'cicd/cloudbuild-backend.yaml',
-                        'require_approval': True
-                    }
-                ]
-            }
-        """
-        return self._make_request(
-            'POST',
-            f'platform/projects/{project_id}/triggers',
-            data=trigger_config,
-            require_auth=True
-        )
+    Args:
+        dev_mode: Use the local Admin API instead of the deployed one
+
+    Returns:
+        AdminClient for that mode
+    """
+    return AdminClient(dev_mode=dev_mode)
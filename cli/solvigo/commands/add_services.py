@@ -1,10 +1,16 @@
 """
 Add services to existing project - discovers GCP resources and generates Terraform
 """
+from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 
-from solvigo.gcp.discovery import ResourceDiscovery, verify_gcp_project_access
+from solvigo.admin.client import get_admin_client
+from solvigo.commands.import_cmd import select_project_interactive
+from solvigo.gcp.apis import ensure_discovery_apis
+from solvigo.gcp.discovery import ResourceDiscovery, list_accessible_projects, verify_gcp_project_access
+from solvigo.terraform.generator import generate_all_tf, generate_terraform_config
+from solvigo.terraform.runner import run_terraform_apply, run_terraform_plan
 from solvigo.ui.prompts import select_resources, confirm_action
 
 console = Console()
@@ -17,9 +23,6 @@ def add_services_to_existing_project(context: dict):
     Args:
         context: Project context
     """
-    from solvigo.gcp.discovery import list_accessible_projects
-    from solvigo.commands.import_cmd import select_project_interactive
-
     client = context.get('client')
     project = context.get('project')
     gcp_project_id = context.get('gcp_project_id')
@@ -29,8 +32,7 @@ def add_services_to_existing_project(context: dict):
     # If subdomains not in context, fetch from database for consistent SA naming
     if (not client_subdomain or not project_subdomain) and project:
         try:
-            from solvigo.admin.client import AdminClient
-            registry = AdminClient()
+            registry = get_admin_client()
             project_info = registry.get_project(project)
 
             if not client_subdomain:
@@ -48,18 +50,12 @@ def add_services_to_existing_project(context: dict):
     # List all accessible projects
     console.print("[cyan]🔍 Listing your GCP projects...[/cyan]\n")
 
-    projects = list_accessible_projects()
-
-    if not projects:
-        console.print("[red]✗ No GCP projects found or accessible[/red]")
-        console.print("[yellow]Make sure you're authenticated: gcloud auth login[/yellow]\n")
-        return
-
-    # Filter to active projects
-    active_projects = [p for p in projects if p.get('state') == 'ACTIVE']
+    # Only ACTIVE projects are listed (filtered by the Resource Manager API)
+    active_projects = list_accessible_projects()
 
     if not active_projects:
-        console.print("[yellow]No active projects found.[/yellow]\n")
+        console.print("[red]✗ No active GCP projects found or accessible[/red]")
+        console.print("[yellow]Make sure you're authenticated: gcloud auth login[/yellow]\n")
         return
 
     console.print(f"[green]✓ Found {len(active_projects)} accessible projects[/green]\n")
@@ -84,12 +80,13 @@ def add_services_to_existing_project(context: dict):
     console.print(f"[green]✓ Project accessible[/green]")
 
     # Ensure required APIs are enabled for discovery
-    from solvigo.gcp.apis import ensure_discovery_apis
-
     api_result = ensure_discovery_apis(gcp_project_id)
 
     # Discover resources
-    discovery = ResourceDiscovery(gcp_project_id)
+    discovery = ResourceDiscovery(
+        gcp_project_id,
+        enabled_apis=api_result['enabled_apis'] | set(api_result['newly_enabled'])
+    )
     resources = discovery.discover_all()
 
     # Track which APIs were enabled (for Terraform generation later)
@@ -101,8 +98,9 @@ def add_services_to_existing_project(context: dict):
     console.print("[bold]Select services to add to Terraform:[/bold]\n")
 
     selected = select_resources(resources, client=client, project=project)
+    counts = {resource_type: len(items) for resource_type, items in (selected or {}).items() if items}
 
-    if not selected or all(len(v) == 0 for v in selected.values()):
+    if not counts:
         console.print("\n[yellow]No resources selected.[/yellow]")
         return
 
@@ -110,13 +108,10 @@ def add_services_to_existing_project(context: dict):
     console.print("\n" + "─" * 64 + "\n")
     console.print("[bold]Summary of selected resources:[/bold]\n")
 
-    total = 0
-    for resource_type, items in selected.items():
-        if items:
-            console.print(f"  • {resource_type}: {len(items)} items")
-            total += len(items)
+    for resource_type, count in counts.items():
+        console.print(f"  • {resource_type}: {count} items")
 
-    console.print(f"\n[cyan]Total: {total} resources[/cyan]\n")
+    console.print(f"\n[cyan]Total: {sum(counts.values())} resources[/cyan]\n")
 
     # Confirm
     if not confirm_action("Generate Terraform configuration?", default=True):
@@ -124,8 +119,6 @@ def add_services_to_existing_project(context: dict):
         return
 
     # ═══ Terraform Generation ═══
-    from pathlib import Path
-
     # Detect terraform directory
     terraform_dir = context.get('terraform_path')
 
@@ -134,15 +127,12 @@ def add_services_to_existing_project(context: dict):
         console.print("\n[yellow]No terraform directory found - creating from scratch[/yellow]\n")
 
         # Ask where to generate
-        from pathlib import Path
         terraform_dir = Path.cwd() / 'terraform'
 
         if confirm_action(f"Create terraform directory at {terraform_dir}?", default=True):
             terraform_dir.mkdir(parents=True, exist_ok=True)
 
             # Generate complete configuration (like import)
-            from solvigo.terraform.generator import generate_terraform_config
-
             if not generate_terraform_config(
                 client, project, selected, terraform_dir, gcp_project_id,
                 client_subdomain=client_subdomain,
@@ -158,51 +148,15 @@ def add_services_to_existing_project(context: dict):
         console.print(f"\n[green]✓ Using existing terraform: {terraform_dir}[/green]\n")
         console.print("[cyan]📝 Adding new resources to existing configuration...[/cyan]\n")
 
-        from solvigo.terraform.generator import (
-            generate_cloud_run_tf,
-            generate_cloud_sql_tf,
-            generate_storage_tf,
-            generate_secrets_tf,
-            generate_service_accounts_tf,
-            generate_imports_tf
-        )
-
         # Append to existing files
         try:
-            if selected.get('cloud_run'):
-                generate_cloud_run_tf(
-                    client, project, selected['cloud_run'], terraform_dir,
-                    append=True,
-                    has_database=bool(selected.get('cloud_sql') or selected.get('firestore')),
-                    client_subdomain=client_subdomain,
-                    project_subdomain=project_subdomain
-                )
-                console.print("  ✓ Updated cloud-run.tf")
-
-            if selected.get('cloud_sql'):
-                generate_cloud_sql_tf(
-                    client, project, selected['cloud_sql'], terraform_dir,
-                    append=True,
-                    client_subdomain=client_subdomain,
-                    project_subdomain=project_subdomain
-                )
-                console.print("  ✓ Updated database-sql.tf")
-
-            if selected.get('storage'):
-                generate_storage_tf(client, project, selected['storage'], terraform_dir, append=True)
-                console.print("  ✓ Updated storage.tf")
-
-            if selected.get('secrets'):
-                generate_secrets_tf(client, project, selected['secrets'], terraform_dir, append=True)
-                console.print("  ✓ Updated secrets.tf")
-
-            if selected.get('service_accounts'):
-                generate_service_accounts_tf(client, project, selected['service_accounts'], terraform_dir, append=True)
-                console.print("  ✓ Updated service-accounts.tf")
-
-            # Always update imports.tf
-            generate_imports_tf(client, project, selected, terraform_dir, append=True)
-            console.print("  ✓ Updated imports.tf")
+            for file_name in generate_all_tf(
+                client, project, selected, terraform_dir, gcp_project_id,
+                append=True,
+                client_subdomain=client_subdomain,
+                project_subdomain=project_subdomain
+            ):
+                console.print(f"  ✓ Updated {file_name}")
 
             console.print(f"\n[green]✓ Resources added to Terraform configuration[/green]\n")
 
@@ -214,16 +168,12 @@ def add_services_to_existing_project(context: dict):
     console.print("─" * 64 + "\n")
 
     if confirm_action("Run terraform plan to preview changes?", default=True):
-        from solvigo.terraform.runner import run_terraform_plan
-
         console.print("\n[cyan]Running terraform plan...[/cyan]\n")
 
         if run_terraform_plan(terraform_dir):
             console.print("\n[green]✓ Plan complete[/green]\n")
 
             if confirm_action("Apply changes?", default=False):
-                from solvigo.terraform.runner import run_terraform_apply
-
                 if run_terraform_apply(terraform_dir):
                     console.print("\n[green]✅ Resources added successfully![/green]\n")
                 else:
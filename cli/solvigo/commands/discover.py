@@ -1,11 +1,10 @@
 """
 Discover resources in a GCP project
 """
+from typing import Dict, List, Tuple, Union
 from rich.console import Console
 from rich.table import Table
 
-from solvigo.gcp.discovery import ResourceDiscovery, verify_gcp_project_access
-
 console = Console()
 
 
@@ -16,6 +15,8 @@ def discover_resources(gcp_project_id: str):
     Args:
         gcp_project_id: GCP project ID
     """
+    from solvigo.gcp.discovery import ResourceDiscovery, verify_gcp_project_access
+
     console.print(f"\n[bold cyan]Discovering resources in: {gcp_project_id}[/bold cyan]\n")
 
     # Verify access
@@ -24,70 +25,70 @@ def discover_resources(gcp_project_id: str):
         console.print("[yellow]Make sure you're authenticated: gcloud auth login[/yellow]")
         return
 
-    # Discover
+    # Show each resource type as soon as its discovery finishes
     discovery = ResourceDiscovery(gcp_project_id)
-    resources = discovery.discover_all()
-
-    # Display detailed results
+    console.print(f"🔍 Scanning GCP project: [cyan]{gcp_project_id}[/cyan]...")
     console.print("\n" + "═" * 64 + "\n")
 
-    # Cloud Run
-    if resources.get('cloud_run'):
-        console.print("[bold cyan]Cloud Run Services:[/bold cyan]\n")
-        table = Table()
-        table.add_column("Name")
-        table.add_column("Region")
-        table.add_column("Type")
-        table.add_column("URL")
-
-        for service in resources['cloud_run']:
-            table.add_row(
-                service['name'],
-                service.get('region', 'unknown'),
-                service.get('type', 'unknown'),
-                service.get('url', '-')
-            )
-
-        console.print(table)
-        console.print()
+    # Storage, secrets and service accounts are only counted, never listed
+    for resource_type, items in discovery.iter_discovered(summary=True):
+        if items:
+            print_resources(resource_type, items)
 
-    # Cloud SQL
-    if resources.get('cloud_sql'):
-        console.print("[bold cyan]Cloud SQL Databases:[/bold cyan]\n")
-        table = Table()
-        table.add_column("Name")
-        table.add_column("Version")
-        table.add_column("Tier")
-        table.add_column("Region")
-
-        for db in resources['cloud_sql']:
-            table.add_row(
-                db['name'],
-                db.get('database_version', 'unknown'),
-                db.get('tier', 'unknown'),
-                db.get('region', 'unknown')
-            )
-
-        console.print(table)
-        console.print()
+    console.print("═" * 64 + "\n")
 
-    # Storage
-    if resources.get('storage'):
-        console.print(f"[bold cyan]Storage Buckets:[/bold cyan] {len(resources['storage'])} found\n")
 
-    # Secrets
-    if resources.get('secrets'):
-        console.print(f"[bold cyan]Secrets:[/bold cyan] {len(resources['secrets'])} found\n")
+def print_resources(resource_type: str, items: Union[List[Dict], int]):
+    """
+    Display the discovered resources of one type.
+
+    Args:
+        resource_type: Resource type key from ResourceDiscovery
+        items: Discovered resources of that type, or their count for count-only types
+    """
+    if resource_type == 'cloud_run':
+        # Discovery always sets these keys, but gcloud may leave values empty
+        print_table("Cloud Run Services", ("Name", "Region", "Type", "URL"), [
+            (s['name'], s['region'] or 'unknown', s['type'] or 'unknown', s['url'] or '-')
+            for s in items
+        ])
+
+    elif resource_type == 'cloud_sql':
+        print_table("Cloud SQL Databases", ("Name", "Version", "Tier", "Region"), [
+            (db['name'], db['database_version'] or 'unknown', db['tier'] or 'unknown', db['region'] or 'unknown')
+            for db in items
+        ])
 
-    # Service Accounts
-    if resources.get('service_accounts'):
-        console.print(f"[bold cyan]Service Accounts:[/bold cyan] {len(resources['service_accounts'])} found\n")
+    elif resource_type == 'storage':
+        console.print(f"[bold cyan]Storage Buckets:[/bold cyan] {items} found\n")
 
-    # APIs
-    if resources.get('apis'):
+    elif resource_type == 'secrets':
+        console.print(f"[bold cyan]Secrets:[/bold cyan] {items} found\n")
+
+    elif resource_type == 'service_accounts':
+        console.print(f"[bold cyan]Service Accounts:[/bold cyan] {items} found\n")
+
+    elif resource_type == 'apis':
         console.print("[bold cyan]Enabled APIs:[/bold cyan]\n")
-        for api in resources['apis']:
+        for api in items:
             console.print(f"  • {api['title']}")
         console.print()
 
-    console.print("═" * 64 + "\n")
+
+def print_table(title: str, headers: Tuple[str, ...], rows: List[Tuple[str, ...]]):
+    """
+    Print a titled table of pre-built string rows.
+
+    Args:
+        title: Section title
+        headers: Column headers
+        rows: One tuple of cell values per row
+    """
+    console.print(f"[bold cyan]{title}:[/bold cyan]\n")
+
+    table = Table(*headers)
+    for row in rows:
+        table.add_row(*row)
+
+    console.print(table)
+    console.print()
@@ -3,23 +3,68 @@ Import existing GCP project into Solvigo platform
 """
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
-from solvigo.gcp.discovery import ResourceDiscovery, verify_gcp_project_access
 from solvigo.ui.prompts import text_input, select_resources, confirm_action, select_option
 
 console = Console()
 
+# Navigation choices in the project browser, keyed by their leading glyph
+NAV_ACTIONS = {'←': 'prev', '→': 'next', '🔍': 'search', '❌': 'cancel'}
 
-def select_project_interactive(projects: list) -> str:
+# Navigation options shown after the projects, by page position
+NAV_CHOICES = {
+    'only': ["🔍 Search instead", "❌ Cancel"],
+    'first': ["→ Next page", "🔍 Search instead", "❌ Cancel"],
+    'middle': ["← Previous page", "→ Next page", "🔍 Search instead", "❌ Cancel"],
+    'last': ["← Previous page", "🔍 Search instead", "❌ Cancel"],
+}
+
+
+def build_search_index(projects: list) -> list:
+    """
+    Precompute search keys and choice labels once so searches and pages reuse them.
+
+    Args:
+        projects: List of project dicts
+
+    Returns:
+        List of (project_id_lower, name_lower, label, project) tuples
+    """
+    return [
+        (p['project_id'].lower(), (p['name'] or '').lower(), f"{p['project_id']} - {p['name']}", p)
+        for p in projects
+    ]
+
+
+def match_projects(index: list, search_term: str) -> list:
+    """
+    Find projects whose ID or name contains the search term.
+
+    Args:
+        index: Search index from build_search_index()
+        search_term: Lowercased search term
+
+    Returns:
+        Matching index entries, in index order
+    """
+    return [entry for entry in index if search_term in entry[0] or search_term in entry[1]]
+
+
+def select_project_interactive(projects: list, index: list = None) -> str:
     """
     Let user select a project with search or pagination.
 
     Args:
         projects: List of project dicts
+        index: Search index for projects (built if not provided)
 
     Returns:
         Selected project ID
     """
+    if index is None:
+        index = build_search_index(projects)
+
     choice = select_option(
         "How would you like to find your project?",
         choices=[
@@ -34,11 +79,7 @@ def select_project_interactive(projects: list) -> str:
             "Search for project (name or ID):"
         ).lower()
 
-        # Filter projects
-        matches = [
-            p for p in projects
-            if search_term in p['project_id'].lower() or search_term in p['name'].lower()
-        ]
+        matches = match_projects(index, search_term)
 
         if not matches:
             console.print(f"\n[yellow]No projects matching '{search_term}'[/yellow]\n")
@@ -49,136 +90,147 @@ def select_project_interactive(projects: list) -> str:
         # Show matches
         if len(matches) <= 20:
             # Show all matches
-            project_choices = [f"{p['project_id']} - {p['name']}" for p in matches]
+            label_to_pid = {label: p['project_id'] for _, _, label, p in matches}
             selected = select_option(
                 "Select project:",
-                choices=project_choices
+                choices=list(label_to_pid)
             )
-            return selected.split(' - ')[0]
+            return label_to_pid[selected]
         else:
-            # Still too many, browse them
-            return browse_projects_paginated(matches)
+            # Still too many, browse them (the matches are their own search index)
+            return browse_projects_paginated([p for _, _, _, p in matches], index=matches)
     else:
         # Browse mode with pagination
-        return browse_projects_paginated(projects)
+        return browse_projects_paginated(projects, index=index)
 
 
-def browse_projects_paginated(projects: list, page_size: int = 15) -> str:
+def browse_projects_paginated(projects: list, page_size: int = 15, index: list = None) -> str:
     """
     Browse projects with pagination.
 
     Args:
         projects: List of project dicts
         page_size: Number of projects per page
+        index: Search index for projects (built if not provided)
 
     Returns:
         Selected project ID
     """
+    if index is None:
+        index = build_search_index(projects)
+
     page = 0
+    label_to_pid = {label: p['project_id'] for _, _, label, p in index}
+    labels = list(label_to_pid)
     total_pages = (len(projects) + page_size - 1) // page_size
 
+    # Tables are built the first time a page is shown and reused when paging back
+    page_tables = {}
+
     while True:
         start_idx = page * page_size
         end_idx = min(start_idx + page_size, len(projects))
-        page_projects = projects[start_idx:end_idx]
 
         # Show current page
         console.print(f"\n[cyan]Page {page + 1} of {total_pages}[/cyan] (Projects {start_idx + 1}-{end_idx} of {len(projects)})\n")
 
-        table = Table(show_header=True, header_style="bold cyan")
-        table.add_column("#", style="dim", width=4)
-        table.add_column("Project ID", style="cyan")
-        table.add_column("Name", style="white")
-
-        for i, proj in enumerate(page_projects, start=1):
-            table.add_row(
-                str(start_idx + i),
-                proj['project_id'],
-                proj['name']
-            )
+        if page not in page_tables:
+            table = Table(show_header=True, header_style="bold cyan")
+            table.add_column("#", style="dim", width=4)
+            table.add_column("Project ID", style="cyan")
+            table.add_column("Name", style="white")
+
+            for i, proj in enumerate(projects[start_idx:end_idx], start=1):
+                table.add_row(
+                    str(start_idx + i),
+                    proj['project_id'],
+                    proj['name']
+                )
+            page_tables[page] = table
 
-        console.print(table)
+        console.print(page_tables[page])
         console.print()
 
-        # Create choices for this page
-        choices = [f"{p['project_id']} - {p['name']}" for p in page_projects]
-
-        # Add navigation options
-        if page > 0:
-            choices.append("← Previous page")
-        if page < total_pages - 1:
-            choices.append("→ Next page")
-        choices.append("🔍 Search instead")
-        choices.append("❌ Cancel")
+        # Project choices for this page plus navigation options
+        if total_pages <= 1:
+            position = 'only'
+        elif page == 0:
+            position = 'first'
+        elif page == total_pages - 1:
+            position = 'last'
+        else:
+            position = 'middle'
+        choices = labels[start_idx:end_idx] + NAV_CHOICES[position]
 
         selected = select_option(
             f"Select project (page {page + 1}/{total_pages}):",
             choices=choices
         )
 
-        if "Previous" in selected:
+        # Project labels start with the project ID, never with a navigation glyph
+        action = NAV_ACTIONS.get(selected[:1])
+
+        if action == 'prev':
             page -= 1
-        elif "Next" in selected:
+        elif action == 'next':
             page += 1
-        elif "Search" in selected:
-            return search_projects(projects)
-        elif "Cancel" in selected:
+        elif action == 'search':
+            return search_projects(index)
+        elif action == 'cancel':
             return None
         else:
             # Project selected
-            return selected.split(' - ')[0]
+            return label_to_pid[selected]
 
 
-def search_projects(projects: list) -> str:
+def search_projects(index: list) -> str:
     """
     Search for a project by name or ID.
 
     Args:
-        projects: List of project dicts
+        index: Search index from build_search_index()
 
     Returns:
         Selected project ID or None
     """
-    search_term = text_input(
-        "Search for project (name or ID):"
-    ).lower()
-
-    # Filter projects
-    matches = [
-        p for p in projects
-        if search_term in p['project_id'].lower() or search_term in p['name'].lower()
-    ]
+    while True:
+        search_term = text_input(
+            "Search for project (name or ID):"
+        ).lower()
 
-    if not matches:
-        console.print(f"\n[yellow]No projects matching '{search_term}'[/yellow]")
-        retry = confirm_action("Try again?", default=True)
-        if retry:
-            return search_projects(projects)
-        return None
-
-    console.print(f"\n[green]Found {len(matches)} matching project(s):[/green]\n")
-
-    if len(matches) == 1:
-        # Only one match, auto-select
-        proj = matches[0]
-        console.print(f"  → {proj['project_id']} - {proj['name']}\n")
-        if confirm_action("Use this project?", default=True):
-            return proj['project_id']
-        return search_projects(projects)
-
-    # Multiple matches
-    project_choices = [f"{p['project_id']} - {p['name']}" for p in matches]
-    project_choices.append("🔍 Search again")
-
-    selected = select_option(
-        "Select project:",
-        choices=project_choices
-    )
+        matches = match_projects(index, search_term)
+
+        if not matches:
+            console.print(f"\n[yellow]No projects matching '{search_term}'[/yellow]")
+            if confirm_action("Try again?", default=True):
+                continue
+            return None
+
+        console.print(f"\n[green]Found {len(matches)} matching project(s):[/green]\n")
+
+        if len(matches) == 1:
+            # Only one match, auto-select
+            _, _, label, proj = matches[0]
+            console.print(f"  → {label}\n")
+            if confirm_action("Use this project?", default=True):
+                return proj['project_id']
+            continue
+
+        # Multiple matches
+        label_to_pid = {label: p['project_id'] for _, _, label, p in matches}
+        project_choices = list(label_to_pid)
+        project_choices.append("🔍 Search again")
+
+        selected = select_option(
+            "Select project:",
+            choices=project_choices
+        )
 
-    if "Search again" in selected:
-        return search_projects(projects)
+        if selected not in label_to_pid:
+            # "Search again"
+            continue
 
-    return selected.split(' - ')[0]
+        return label_to_pid[selected]
 
 
 def import_existing_project(gcp_project_id: str, client: str = None,
@@ -192,14 +244,16 @@ def import_existing_project(gcp_project_id: str, client: str = None,
         project: Project name (optional, will prompt if not provided)
         dry_run: Whether to do dry run
     """
+    from solvigo.gcp.discovery import ResourceDiscovery, verify_gcp_project_access
+
     console.print(f"\n[cyan]🔍 Importing GCP project: {gcp_project_id}[/cyan]\n")
 
     # Verify access
     if not verify_gcp_project_access(gcp_project_id):
-        console.print(f"[red]✗ Cannot access project {gcp_project_id}[/red]")
+        console.print(Text(f"✗ Cannot access project {gcp_project_id}", style="red"))
         return
 
-    console.print(f"[green]✓ Project accessible[/green]")
+    console.print(Text("✓ Project accessible", style="green"))
 
     # Get client/project if not provided
     if not client:
@@ -207,6 +261,9 @@ def import_existing_project(gcp_project_id: str, client: str = None,
     if not project:
         project = text_input("Project name:")
 
+    client_slug = client.lower().replace(' ', '-')
+    project_slug = project.lower().replace(' ', '-')
+
     # ═══ Folder Organization ═══
     # Get or create client folder and move project into it
     from solvigo.gcp.folders import get_or_create_client_folder, move_project_to_folder
@@ -227,7 +284,7 @@ def import_existing_project(gcp_project_id: str, client: str = None,
                 console.print("[dim]Continuing without folder organization...[/dim]\n")
 
         except Exception as e:
-            console.print(f"[yellow]⚠ Folder management error: {e}[/yellow]")
+            console.print(Text(f"⚠ Folder management error: {e}", style="yellow"))
             console.print("[dim]Continuing import...[/dim]\n")
     else:
         console.print("[dim]SOLVIGO_FOLDER_ID not set - skipping folder organization[/dim]\n")
@@ -238,7 +295,10 @@ def import_existing_project(gcp_project_id: str, client: str = None,
     api_result = ensure_discovery_apis(gcp_project_id)
 
     # Discover resources
-    discovery = ResourceDiscovery(gcp_project_id)
+    discovery = ResourceDiscovery(
+        gcp_project_id,
+        enabled_apis=api_result['enabled_apis'] | set(api_result['newly_enabled'])
+    )
     resources = discovery.discover_all()
 
     # Track which APIs were enabled (for Terraform generation)
@@ -249,7 +309,7 @@ def import_existing_project(gcp_project_id: str, client: str = None,
     console.print("\n" + "─" * 64 + "\n")
     selected = select_resources(resources, client=client, project=project)
 
-    if not selected or all(len(v) == 0 for v in selected.values()):
+    if not selected or not any(selected.values()):
         console.print("\n[yellow]No resources selected.[/yellow]")
         return
 
@@ -264,7 +324,7 @@ def import_existing_project(gcp_project_id: str, client: str = None,
 
     repo_path = prompt_repository_location(client, project)
 
-    console.print(f"\n[green]✓ Will generate code in:[/green] {repo_path}\n")
+    console.print(Text.assemble("\n", ("✓ Will generate code in:", "green"), f" {repo_path}\n"))
 
     # Create output directories in the client repository
     terraform_dir = repo_path / 'terraform'
@@ -290,7 +350,7 @@ def import_existing_project(gcp_project_id: str, client: str = None,
         client_subdomain=None,
         project_subdomain=None
     ):
-        console.print("[red]✗ Failed to generate Terraform configuration[/red]\n")
+        console.print(Text("✗ Failed to generate Terraform configuration\n", style="red"))
         return
 
     # ═══ CI/CD Setup ═══
@@ -316,7 +376,6 @@ def import_existing_project(gcp_project_id: str, client: str = None,
 
         # Collect service configurations (using repo_path from above)
         services = []
-        project_slug = project.lower().replace(' ', '-')
 
         if app_type in ['backend', 'fullstack']:
             dockerfile = prompt_dockerfile_location('backend', repo_path)
@@ -351,7 +410,7 @@ def import_existing_project(gcp_project_id: str, client: str = None,
             github_connection_id = get_github_connection_id()
 
             if not github_connection_id:
-                console.print("[yellow]⚠ Skipping CI/CD setup (GitHub connection not configured)[/yellow]\n")
+                console.print(Text("⚠ Skipping CI/CD setup (GitHub connection not configured)\n", style="yellow"))
             else:
                 # Generate CI/CD files in cicd/ folder (already created above)
                 from solvigo.terraform.cicd_generator import generate_all_cicd_files
@@ -378,71 +437,73 @@ def import_existing_project(gcp_project_id: str, client: str = None,
 
                     # Register project in Solvigo registry
                     try:
-                        from solvigo.admin.client import AdminClient
+                        from solvigo.admin.client import get_admin_client
 
                         console.print("[cyan]Registering project in Solvigo registry...[/cyan]")
 
                         # Note: import doesn't get context yet, so dev_mode isn't available here
                         # TODO: Consider passing dev flag through import command
-                        registry = AdminClient()
-
-                        # Prepare project data
-                        client_slug = client.lower().replace(' ', '-')
-                        project_slug = project.lower().replace(' ', '-')
+                        registry = get_admin_client()
 
-                        # Register client (if new)
-                        try:
-                            registry.register_client({
-                                'id': client_slug,
-                                'name': client,
-                                'subdomain': client_slug
-                            })
-                        except Exception as e:
-                            # Client might already exist, that's ok
-                            pass
-
-                        # Fetch client details to get actual subdomain
+                        # An existing client keeps its registered subdomain
                         try:
                             client_details = registry.get_client(client_slug)
                             client_subdomain = client_details['subdomain']
                         except Exception:
-                            # If fetch fails, fall back to client_slug
+                            # New client (or fetch failed) - register it with client_slug
                             client_subdomain = client_slug
 
                         # For imported projects, use slug as subdomain
                         project_subdomain = project_slug
 
+                        registry_project_id = f"{client_subdomain}-{project_slug}"
+                        # Per-environment settings, shared by the environment and service data
+                        # Resource names get an -<env> suffix everywhere except prod
+                        env_meta = {
+                            e: {
+                                'suffix': "" if e == 'prod' else f"-{e}",
+                                'auto_deploy': e == 'staging',
+                                'requires_approval': e == 'prod'
+                            }
+                            for e in environments
+                        }
+
                         # Prepare environment data
                         env_data = []
-                        for env_name in environments:
+                        for env_name, meta in env_meta.items():
                             env_data.append({
-                                'project_id': f"{client_subdomain}-{project_slug}",
+                                'project_id': registry_project_id,
                                 'name': env_name,
-                                'database_instance': f"{project_subdomain}-db-{env_name}" if env_name != 'prod' else f"{project_subdomain}-db",
+                                'database_instance': f"{project_subdomain}-db{meta['suffix']}",
                                 'database_type': 'postgresql',  # TODO: detect from selected resources
-                                'auto_deploy': (env_name == 'staging'),
-                                'requires_approval': (env_name == 'prod')
+                                'auto_deploy': meta['auto_deploy'],
+                                'requires_approval': meta['requires_approval']
                             })
 
                         # Prepare service data
                         svc_data = []
                         for svc in services:
-                            for env_name in environments:
-                                svc_suffix = f"-{env_name}" if env_name != 'prod' else ""
+                            cloudbuild_file = f"cicd/cloudbuild-{svc['type']}.yaml"
+                            for env_name, meta in env_meta.items():
+                                svc_env_name = f"{svc['name']}{meta['suffix']}"
                                 svc_data.append({
-                                    'project_id': f"{client_subdomain}-{project_slug}",
-                                    'name': f"{svc['name']}{svc_suffix}",
+                                    'project_id': registry_project_id,
+                                    'name': svc_env_name,
                                     'type': svc['type'],
                                     'environment': env_name,
-                                    'cloud_run_service': f"{svc['name']}{svc_suffix}",
+                                    'cloud_run_service': svc_env_name,
                                     'cloud_run_region': 'europe-north1',
                                     'dockerfile_path': svc['dockerfile'],
-                                    'cloudbuild_file': f"cicd/cloudbuild-{svc['type']}.yaml"
+                                    'cloudbuild_file': cloudbuild_file
                                 })
 
-                        # Register project
-                        registry.register_project({
-                            'id': f"{client_subdomain}-{project_slug}",
+                        # Register client (if new) and project in one transaction
+                        registry.register_bulk({
+                            'id': client_slug,
+                            'name': client,
+                            'subdomain': client_slug
+                        }, {
+                            'id': registry_project_id,
                             'client_id': client_slug,
                             'name': project,
                             'subdomain': project_slug,
@@ -456,10 +517,10 @@ def import_existing_project(gcp_project_id: str, client: str = None,
                             'services': svc_data
                         })
 
-                        console.print("[green]✓ Registered in Solvigo registry[/green]\n")
+                        console.print(Text("✓ Registered in Solvigo registry\n", style="green"))
 
                     except Exception as e:
-                        console.print(f"[yellow]⚠ Could not register in registry: {e}[/yellow]")
+                        console.print(Text(f"⚠ Could not register in registry: {e}", style="yellow"))
                         console.print("[dim]Continuing without registry (not critical)...[/dim]\n")
 
                     console.print("[cyan]Next steps:[/cyan]")
@@ -508,24 +569,18 @@ def interactive_import_project():
     # List all accessible projects
     console.print("[cyan]🔍 Listing your GCP projects...[/cyan]\n")
 
-    projects = list_accessible_projects()
-
-    if not projects:
-        console.print("[red]✗ No GCP projects found or accessible[/red]")
-        console.print("[yellow]Make sure you're authenticated: gcloud auth login[/yellow]\n")
-        return
-
-    # Filter to only ACTIVE projects
-    active_projects = [p for p in projects if p.get('state') == 'ACTIVE']
+    # Only ACTIVE projects are listed (filtered by the Resource Manager API)
+    active_projects = list_accessible_projects()
 
     if not active_projects:
-        console.print("[yellow]No active projects found.[/yellow]\n")
+        console.print(Text("✗ No active GCP projects found or accessible", style="red"))
+        console.print("[yellow]Make sure you're authenticated: gcloud auth login[/yellow]\n")
         return
 
-    console.print(f"[green]✓ Found {len(active_projects)} accessible projects[/green]\n")
+    console.print(Text(f"✓ Found {len(active_projects)} accessible projects\n", style="green"))
 
-    # Let user choose search or browse
-    gcp_project_id = select_project_interactive(active_projects)
+    # Let user choose search or browse (the index is shared by every search retry)
+    gcp_project_id = select_project_interactive(active_projects, build_search_index(active_projects))
 
     if not gcp_project_id:
         console.print("\n[yellow]No project selected.[/yellow]\n")
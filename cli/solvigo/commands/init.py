@@ -3,14 +3,18 @@ Initialize new project - create infrastructure and scaffold code
 """
 import os
 import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Tuple
 from rich.console import Console
 from rich.table import Table
 
 from solvigo.ui.prompts import text_input, select_option, confirm_action
-from solvigo.admin.client import AdminClient
-from solvigo.gcp.discovery import verify_gcp_project_access
+from solvigo.admin.client import get_admin_client
+from solvigo.terraform.cicd_generator import generate_all_cicd_files
 from solvigo.terraform.generator import generate_terraform_config
+from solvigo.utils.bootstrap import bootstrap_infrastructure
 from solvigo.ui.cicd_prompts import (
     prompt_cicd_setup,
     prompt_application_type,
@@ -27,6 +31,12 @@ from solvigo.ui.cicd_prompts import (
 
 console = Console()
 
+# Client selection value for the "create new client" entry
+NEW_CLIENT = '__new__'
+
+# gcloud errors meaning the project is already attached to the Shared VPC host
+_SHARED_VPC_CONNECTED_ERRORS = ('already exists', 'already associated', 'already a service project')
+
 
 def create_project(client: str, project: str, environment: str, stack: str,
                   database: str, new_client: bool, dry_run: bool):
@@ -38,6 +48,139 @@ def create_project(client: str, project: str, environment: str, stack: str,
     pass
 
 
+def _ensure_state_bucket(bucket_name: str, gcp_project_id: str) -> Tuple[str, str]:
+    """
+    Create the Terraform state bucket unless it already exists.
+
+    Uses the Cloud Storage SDK in-process, falling back to gcloud (the
+    user's active account) when the SDK or application default credentials
+    are not available or lack access.
+
+    Args:
+        bucket_name: State bucket name
+        gcp_project_id: GCP project to create the bucket in
+
+    Returns:
+        (status, error) where status is 'exists', 'created' or 'failed'
+    """
+    try:
+        from google.api_core.exceptions import Forbidden, GoogleAPICallError, PermissionDenied
+        from google.auth.exceptions import GoogleAuthError
+        from google.cloud import storage
+    except ImportError:
+        return _ensure_state_bucket_gcloud(bucket_name, gcp_project_id)
+
+    try:
+        client = storage.Client(project=gcp_project_id)
+        if client.lookup_bucket(bucket_name) is not None:
+            return 'exists', ''
+        client.create_bucket(bucket_name, location='europe-north1')
+        return 'created', ''
+    except (GoogleAuthError, Forbidden, PermissionDenied):
+        # User credentials from `gcloud auth login` aren't visible to the SDK, and
+        # application default credentials may belong to a principal without access
+        return _ensure_state_bucket_gcloud(bucket_name, gcp_project_id)
+    except GoogleAPICallError as e:
+        return 'failed', str(e)
+
+
+def _run_gcloud(command: list) -> Tuple[int, str]:
+    """
+    Run a gcloud command, streaming stderr instead of buffering all output.
+
+    stdout is discarded and, until gcloud reports an error, only the last few
+    stderr lines are kept, so progress output from long commands never
+    accumulates in memory.
+
+    Args:
+        command: gcloud command and arguments
+
+    Returns:
+        (returncode, stderr) where stderr is the error (its `ERROR:` line and
+        every line after it, since gcloud often splits errors across lines)
+        or the stderr tail
+    """
+    proc = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    tail = deque(maxlen=20)
+    error_lines = []
+    for line in iter(proc.stderr.readline, ''):
+        if error_lines or line.startswith('ERROR:'):
+            error_lines.append(line)
+        else:
+            tail.append(line)
+    proc.stderr.close()
+    return proc.wait(), ''.join(error_lines or tail).strip()
+
+
+def _ensure_state_bucket_gcloud(bucket_name: str, gcp_project_id: str) -> Tuple[str, str]:
+    """Create the Terraform state bucket with gcloud unless it already exists"""
+    returncode, _ = _run_gcloud(
+        ['gcloud', 'storage', 'buckets', 'describe', f'gs://{bucket_name}', '--format=value(name)']
+    )
+    if returncode == 0:
+        return 'exists', ''
+
+    returncode, stderr = _run_gcloud(
+        ['gcloud', 'storage', 'buckets', 'create', f'gs://{bucket_name}',
+         '--project', gcp_project_id, '--location', 'europe-north1']
+    )
+    if returncode != 0:
+        return 'failed', stderr
+    return 'created', ''
+
+
+def _connect_shared_vpc(gcp_project_id: str, host_project: str) -> Tuple[int, str]:
+    """
+    Enable the Compute API and attach the project to the Shared VPC host.
+
+    Args:
+        gcp_project_id: Service project to attach
+        host_project: Shared VPC host project
+
+    Returns:
+        (returncode, stderr) of the first failing command, or (0, '')
+    """
+    commands = [
+        # Enable compute API first
+        ['gcloud', 'services', 'enable', 'compute.googleapis.com', '--project', gcp_project_id],
+        # Associate project
+        ['gcloud', 'compute', 'shared-vpc', 'associated-projects', 'add', gcp_project_id,
+         '--host-project', host_project],
+    ]
+    for command in commands:
+        returncode, stderr = _run_gcloud(command)
+        if returncode != 0:
+            return returncode, stderr
+    return 0, ''
+
+
+def _ensure_dirs(parent: Path, names: list) -> list:
+    """
+    Create missing subdirectories of parent.
+
+    One scandir of parent finds the existing children, so only missing
+    directories cost a mkdir.
+
+    Args:
+        parent: Directory to create the subdirectories in (created if missing)
+        names: Subdirectory names
+
+    Returns:
+        Paths of the subdirectories, in the order given
+    """
+    try:
+        with os.scandir(parent) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        os.makedirs(parent)
+        existing = set()
+
+    for name in names:
+        if name not in existing:
+            os.mkdir(parent / name)
+    return [parent / name for name in names]
+
+
 def generate_infrastructure_interactive(context: dict) -> bool:
     """
     Generate infrastructure for an existing registered project.
@@ -64,8 +207,6 @@ def generate_infrastructure_interactive(context: dict) -> bool:
             - client_slug: str - Client slug
             - project_slug: str - Project slug
     """
-    from pathlib import Path
-
     # Extract context
     client_name = context.get('client', '')
     project_id = context.get('project', '')
@@ -76,10 +217,11 @@ def generate_infrastructure_interactive(context: dict) -> bool:
     project_subdomain = context.get('project_subdomain')
 
     # If subdomains not in context, fetch from database
+    # (platform config is fetched alongside since CI/CD setup needs it later)
+    platform_config = None
     if (not client_subdomain or not project_subdomain) and project_id:
+        registry = get_admin_client(context.get('dev', False))
         try:
-            from solvigo.admin.client import AdminClient
-            registry = AdminClient()
             project_info = registry.get_project(project_id)
 
             if not client_subdomain:
@@ -90,6 +232,12 @@ def generate_infrastructure_interactive(context: dict) -> bool:
             console.print(f"[yellow]⚠ Could not fetch project details from database: {e}[/yellow]")
             # Will fall back to slug-based naming
 
+        try:
+            platform_config = registry.get_platform_config()
+        except Exception:
+            # Needs auth; CI/CD setup fetches it again and reports the error there
+            pass
+
     # Derive slugs from project_id if available
     if '-' in project_id:
         parts = project_id.split('-')
@@ -103,13 +251,16 @@ def generate_infrastructure_interactive(context: dict) -> bool:
 
     console.print("[bold]Let's configure infrastructure for your project![/bold]\n")
 
-    # Validate GCP project access
-    console.print(f"[cyan]Verifying access to {gcp_project_id}...[/cyan]")
-    if not verify_gcp_project_access(gcp_project_id):
-        console.print(f"[red]✗ Cannot access project {gcp_project_id}[/red]")
-        console.print("[yellow]Make sure you are authenticated and have permissions.[/yellow]")
-        return {'success': False}
-    console.print(f"[green]✓ Project accessible[/green]\n")
+    # Validate GCP project access (skipped when the caller has just checked it)
+    if not context.get('gcp_access_verified'):
+        from solvigo.gcp.discovery import verify_gcp_project_access
+
+        console.print(f"[cyan]Verifying access to {gcp_project_id}...[/cyan]")
+        if not verify_gcp_project_access(gcp_project_id):
+            console.print(f"[red]✗ Cannot access project {gcp_project_id}[/red]")
+            console.print("[yellow]Make sure you are authenticated and have permissions.[/yellow]")
+            return {'success': False}
+        console.print(f"[green]✓ Project accessible[/green]\n")
 
     # Validate/prompt for repository location
     if not repo_path.exists():
@@ -248,62 +399,50 @@ def generate_infrastructure_interactive(context: dict) -> bool:
         # Fallback for backward compatibility
         bucket_name = f"{client_slug}-{project_slug}-tfstate"
     console.print(f"[dim]Ensuring Terraform state bucket exists: {bucket_name}[/dim]")
+
+    # 7.2 Connect to Shared VPC
+    host_project = "solvigo-platform-prod"
+    console.print(f"[dim]Connecting to Shared VPC (Host: {host_project})...[/dim]")
+
+    # The bucket and Shared VPC steps don't depend on each other, so run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        bucket_future = executor.submit(_ensure_state_bucket, bucket_name, gcp_project_id)
+        vpc_future = executor.submit(_connect_shared_vpc, gcp_project_id, host_project)
+
     try:
-        # Check if exists
-        check = subprocess.run(
-            ['gcloud', 'storage', 'buckets', 'describe', f'gs://{bucket_name}'],
-            capture_output=True, text=True
-        )
-        if check.returncode != 0:
-            # Create
-            result = subprocess.run(
-                ['gcloud', 'storage', 'buckets', 'create', f'gs://{bucket_name}',
-                 '--project', gcp_project_id, '--location', 'europe-north1'],
-                capture_output=True, text=True
-            )
-            if result.returncode != 0:
-                console.print(f"[red]✗ Failed to create state bucket[/red]")
-                console.print(f"[yellow]Error: {result.stderr.strip()}[/yellow]")
-                console.print("[dim]Common issues:[/dim]")
-                console.print("[dim]  • Billing not enabled on the project[/dim]")
-                console.print("[dim]  • Cloud Storage API not enabled[/dim]")
-                console.print("[dim]  • Bucket name already exists globally[/dim]")
-                console.print("[dim]  • Insufficient permissions[/dim]")
-                console.print(f"[yellow]You may need to create it manually with: gcloud storage buckets create gs://{bucket_name} --project {gcp_project_id} --location europe-north1[/yellow]")
-            else:
-                console.print(f"[green]✓ Created state bucket: {bucket_name}[/green]")
+        status, error = bucket_future.result()
+        if status == 'failed':
+            console.print(f"[red]✗ Failed to create state bucket[/red]")
+            console.print(f"[yellow]Error: {error}[/yellow]")
+            console.print("[dim]Common issues:[/dim]")
+            console.print("[dim]  • Billing not enabled on the project[/dim]")
+            console.print("[dim]  • Cloud Storage API not enabled[/dim]")
+            console.print("[dim]  • Bucket name already exists globally[/dim]")
+            console.print("[dim]  • Insufficient permissions[/dim]")
+            console.print(f"[yellow]You may need to create it manually with: gcloud storage buckets create gs://{bucket_name} --project {gcp_project_id} --location europe-north1[/yellow]")
+        elif status == 'created':
+            console.print(f"[green]✓ Created state bucket: {bucket_name}[/green]")
         else:
             console.print(f"[green]✓ State bucket exists[/green]")
     except Exception as e:
         console.print(f"[red]✗ Failed to setup state bucket: {e}[/red]")
         console.print("[yellow]You may need to create it manually.[/yellow]")
 
-    # 7.2 Connect to Shared VPC
-    host_project = "solvigo-platform-prod"
-    console.print(f"[dim]Connecting to Shared VPC (Host: {host_project})...[/dim]")
     try:
-        # Enable compute API first
-        subprocess.run(
-            ['gcloud', 'services', 'enable', 'compute.googleapis.com', '--project', gcp_project_id],
-            check=True, capture_output=True
-        )
+        returncode, error = vpc_future.result()
+    except OSError as e:
+        # gcloud missing or not executable
+        returncode, error = 1, str(e)
 
-        # Associate project
-        subprocess.run(
-            ['gcloud', 'compute', 'shared-vpc', 'associated-projects', 'add', gcp_project_id,
-             '--host-project', host_project],
-            check=True, capture_output=True
-        )
+    if returncode == 0:
         console.print(f"[green]✓ Connected to Shared VPC[/green]")
-    except Exception as e:
-        console.print(f"[yellow]⚠ Could not connect to Shared VPC (might already be connected or lack permissions): {e}[/yellow]")
+    elif any(pattern in error.lower() for pattern in _SHARED_VPC_CONNECTED_ERRORS):
+        console.print(f"[green]✓ Already connected to Shared VPC[/green]")
+    else:
+        console.print(f"[yellow]⚠ Could not connect to Shared VPC (lack of permissions?): {error or f'exit status {returncode}'}[/yellow]")
 
     # 7.3 Generate Terraform
-    terraform_dir = repo_path / 'terraform'
-    cicd_dir = repo_path / 'cicd'
-
-    terraform_dir.mkdir(parents=True, exist_ok=True)
-    cicd_dir.mkdir(parents=True, exist_ok=True)
+    terraform_dir, cicd_dir = _ensure_dirs(repo_path, ['terraform', 'cicd'])
 
     if not gcp_project_id:
         console.print(f"[red]✗ No GCP project ID in context[/red]")
@@ -324,8 +463,6 @@ def generate_infrastructure_interactive(context: dict) -> bool:
         return {'success': False}
 
     # 7.3.5 Bootstrap Essential Resources
-    from solvigo.utils.bootstrap import bootstrap_infrastructure
-
     # Default region for European deployments
     region = 'europe-north1'
 
@@ -343,11 +480,12 @@ def generate_infrastructure_interactive(context: dict) -> bool:
     # 7.4 Generate CI/CD Files
     has_database = bool(selected_resources.get('cloud_sql') or selected_resources.get('firestore'))
     platform_project_id = get_platform_project_id()
-    github_connection_id = get_github_connection_id(dev_mode=context.get('dev', False))
+    github_connection_id = get_github_connection_id(
+        dev_mode=context.get('dev', False),
+        platform_config=platform_config
+    )
 
     if github_connection_id:
-        from solvigo.terraform.cicd_generator import generate_all_cicd_files
-
         cicd_success = generate_all_cicd_files(
             client=client_name,
             project=project_name,
@@ -368,33 +506,30 @@ def generate_infrastructure_interactive(context: dict) -> bool:
             console.print("\n[cyan]🔧 Setting up Cloud Build triggers...[/cyan]")
 
             try:
-                # Import Admin client
-                from solvigo.admin.client import AdminClient
-
                 # Build environment configurations
-                env_configs = []
-                for env_name in environments:
-                    # All environments trigger on push to main branch
-                    env_config = {
-                        'name': env_name,
-                        'branch_pattern': '^main$',
-                        'tag_pattern': None
-                    }
-
-                    # No cloudbuild_file - orchestrator always uses cicd/cloudbuild.yaml
-                    env_configs.append(env_config)
+                # No cloudbuild_file - orchestrator always uses cicd/cloudbuild.yaml
+                # All environments deploy on push to main
+                env_configs = [
+                    {'name': env_name, 'branch_pattern': '^main$', 'tag_pattern': None}
+                    for env_name in environments
+                ]
 
                 # Build service configurations
-                service_configs = []
-                for service in services:
-                    service_configs.append({
+                cloudbuild_files = {
+                    service_type: f"cicd/cloudbuild-{service_type}.yaml"
+                    for service_type in {service['type'] for service in services}
+                }
+                service_configs = [
+                    {
                         'name': service['name'],
                         'type': service['type'],
-                        'cloudbuild_file': f"cicd/cloudbuild-{service['type']}.yaml"
-                    })
+                        'cloudbuild_file': cloudbuild_files[service['type']]
+                    }
+                    for service in services
+                ]
 
                 # Call Admin API to create triggers
-                admin_client = AdminClient(dev_mode=context.get('dev', False))
+                admin_client = get_admin_client(context.get('dev', False))
 
                 trigger_response = admin_client.create_build_triggers(
                     project_id=f"{client_slug}-{project_slug}",
@@ -435,7 +570,7 @@ def generate_infrastructure_interactive(context: dict) -> bool:
     }
 
 
-def interactive_create_project():
+def interactive_create_project(dev_mode: bool = False):
     """
     Create a new project interactively.
     """
@@ -444,7 +579,9 @@ def interactive_create_project():
 
     # 1. Ask for GCP Project ID
     gcp_project_id = text_input("Enter existing GCP Project ID:")
-    
+
+    from solvigo.gcp.discovery import verify_gcp_project_access
+
     console.print(f"[cyan]Verifying access to {gcp_project_id}...[/cyan]")
     if not verify_gcp_project_access(gcp_project_id):
         console.print(f"[red]✗ Cannot access project {gcp_project_id}[/red]")
@@ -454,21 +591,23 @@ def interactive_create_project():
     console.print(f"[green]✓ Project accessible[/green]\n")
 
     # 2. Client Selection
-    # Note: init doesn't get context yet, so dev_mode isn't available here
-    # TODO: Consider passing dev flag through init command
-    registry = AdminClient()
+    registry = get_admin_client(dev_mode)
     try:
         clients = registry.list_clients()
     except Exception as e:
         console.print(f"[yellow]⚠ Could not list clients: {e}[/yellow]")
         clients = []
 
-    client_choices = [f"{c['name']} ({c['id']})" for c in clients]
-    client_choices.append("➕ Create new client")
+    client_choices = [(f"{c['name']} ({c['id']})", c) for c in clients]
+    client_choices.append(("➕ Create new client", NEW_CLIENT))
+
+    client = select_option("Select Client:", choices=client_choices)
 
-    client_choice = select_option("Select Client:", choices=client_choices)
+    if client is None:
+        console.print("\n[dim]Cancelled.[/dim]\n")
+        return
 
-    if client_choice == "➕ Create new client":
+    if client == NEW_CLIENT:
         client_name = text_input("New Client Name:")
         client_slug = client_name.lower().replace(' ', '-')
         client_id = client_slug
@@ -486,16 +625,11 @@ def interactive_create_project():
             console.print(f"[red]✗ Failed to register client: {e}[/red]")
             return
     else:
-        # Use existing client - fetch full details to get subdomain
-        client_id = client_choice.split('(')[1].rstrip(')')
-        try:
-            client_details = registry.get_client(client_id)
-            client_name = client_details['name']
-            client_subdomain = client_details['subdomain']
-            client_slug = client_subdomain  # Use subdomain for backward compatibility
-        except Exception as e:
-            console.print(f"[red]✗ Failed to fetch client details: {e}[/red]")
-            return
+        # The client list already carries name and subdomain
+        client_id = client['id']
+        client_name = client['name']
+        client_subdomain = client['subdomain']
+        client_slug = client_subdomain  # Use subdomain for backward compatibility
 
     # 3. Project Details
     project_name = text_input("Project Name:")
@@ -511,7 +645,8 @@ def interactive_create_project():
         'github_url': '',  # Will be prompted in shared function
         'path': str(prompt_repository_location(client_name, project_name)),
         'client_subdomain': client_subdomain,
-        'project_subdomain': subdomain
+        'project_subdomain': subdomain,
+        'gcp_access_verified': True  # Checked in step 1
     }
 
     # Call shared infrastructure generation function
@@ -532,36 +667,46 @@ def interactive_create_project():
     # 4. Register in Admin API
     console.print("[dim]Registering project in Admin API...[/dim]")
     try:
+        registry_project_id = f"{client_subdomain}-{project_slug}"
+        database_type = (
+            'postgresql' if 'PostgreSQL' in database_choice
+            else 'mysql' if 'MySQL' in database_choice
+            else 'none'
+        )
+        # Resource names get an -<env> suffix everywhere except prod
+        env_suffix = {e: "" if e == 'prod' else f"-{e}" for e in environments}
+
         # Prepare environment data
-        env_data = []
-        for env_name in environments:
-            env_data.append({
-                'project_id': f"{client_subdomain}-{project_slug}",
+        env_data = [
+            {
+                'project_id': registry_project_id,
                 'name': env_name,
-                'database_instance': f"{subdomain}-db-{env_name}" if env_name != 'prod' else f"{subdomain}-db",
-                'database_type': 'postgresql' if 'PostgreSQL' in database_choice else 'mysql' if 'MySQL' in database_choice else 'none',
+                'database_instance': f"{subdomain}-db{env_suffix[env_name]}",
+                'database_type': database_type,
                 'auto_deploy': (env_name == 'staging'),
                 'requires_approval': (env_name == 'prod')
-            })
+            }
+            for env_name in environments
+        ]
 
         # Prepare service data
-        svc_data = []
-        for svc in services:
-            for env_name in environments:
-                svc_suffix = f"-{env_name}" if env_name != 'prod' else ""
-                svc_data.append({
-                    'project_id': f"{client_subdomain}-{project_slug}",
-                    'name': f"{svc['name']}{svc_suffix}",
-                    'type': svc['type'],
-                    'environment': env_name,
-                    'cloud_run_service': f"{svc['name']}{svc_suffix}",
-                    'cloud_run_region': 'europe-north1',
-                    'dockerfile_path': svc['dockerfile'],
-                    'cloudbuild_file': f"cicd/cloudbuild-{svc['type']}.yaml"
-                })
+        svc_data = [
+            {
+                'project_id': registry_project_id,
+                'name': f"{svc['name']}{env_suffix[env_name]}",
+                'type': svc['type'],
+                'environment': env_name,
+                'cloud_run_service': f"{svc['name']}{env_suffix[env_name]}",
+                'cloud_run_region': 'europe-north1',
+                'dockerfile_path': svc['dockerfile'],
+                'cloudbuild_file': f"cicd/cloudbuild-{svc['type']}.yaml"
+            }
+            for svc in services
+            for env_name in environments
+        ]
 
         registry.register_project({
-            'id': f"{client_subdomain}-{project_slug}",
+            'id': registry_project_id,
             'client_id': client_id,
             'name': project_name,
             'subdomain': subdomain,
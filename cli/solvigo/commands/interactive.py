@@ -1,18 +1,30 @@
 """
 Interactive mode - main menu and flow control
 """
-from rich.console import Console
+from pathlib import Path
+
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 
-from solvigo.ui.prompts import main_menu, confirm_action
+from solvigo.admin.client import get_admin_client
+from solvigo.ui.prompts import MainMenuAction, main_menu, confirm_action, select_option, text_input
 from solvigo.commands.add_services import add_services_to_existing_project
-from solvigo.commands.init import interactive_create_project
-from solvigo.commands.import_cmd import interactive_import_project
+from solvigo.commands.deploy import deploy_infrastructure
+from solvigo.commands.init import NEW_CLIENT, interactive_create_project, generate_infrastructure_interactive
+from solvigo.commands.import_cmd import build_search_index, interactive_import_project, match_projects
+from solvigo.commands.status import show_status
+from solvigo.gcp.discovery import list_accessible_projects
+from solvigo.utils.context import exists_cached, find_client_projects, forget_cached_path, list_all_clients
 
 console = Console()
 
 
+def _print_section(*renderables):
+    """Render consecutive output as one group, in a single console write"""
+    console.print(Group(*renderables))
+
+
 def interactive_mode(context: dict):
     """
     Main interactive mode handler.
@@ -20,17 +32,12 @@ def interactive_mode(context: dict):
     Args:
         context: Project context from detect_project_context()
     """
-    from pathlib import Path
-
     project_detected = context.get('exists', False)
 
     # Detect if terraform directory exists
-    has_terraform = False
-    if project_detected:
-        git_root = context.get('git', {}).get('root') or context.get('path')
-        if git_root:
-            terraform_path = Path(git_root) / 'terraform'
-            has_terraform = terraform_path.exists()
+    git_root = context.get('git', {}).get('root') or context.get('path')
+    terraform_path = Path(git_root) / 'terraform' if project_detected and git_root else None
+    has_terraform = terraform_path is not None and exists_cached(terraform_path)
 
     if project_detected:
         # Show project info
@@ -55,47 +62,36 @@ def interactive_mode(context: dict):
         else:
             console.print("[dim]No project detected in current directory.[/dim]\n")
 
+    handlers = {
+        MainMenuAction.GENERATE: handle_generate_infrastructure,
+        MainMenuAction.DEPLOY: handle_deploy,
+        MainMenuAction.DELETE: handle_delete_project,
+        MainMenuAction.CREATE: handle_create_new_project,
+        MainMenuAction.CHOOSE: handle_choose_project,
+        MainMenuAction.IMPORT: handle_import_project,
+    }
+
     try:
         while True:
             # Show main menu with terraform status
-            choice = main_menu(
+            action = main_menu(
                 project_detected=project_detected,
                 client=context.get('client'),
                 project=context.get('project'),
                 has_terraform=has_terraform
             )
 
-            if not choice or '❌ Exit' in choice:
+            if action is MainMenuAction.EXIT:
                 console.print("\n[cyan]Goodbye! 👋[/cyan]\n")
                 break
 
-            # Handle choice
-            if '⚙️ Generate infrastructure' in choice:
-                handle_generate_infrastructure(context)
-                # Refresh terraform status after generation
-                if project_detected:
-                    git_root = context.get('git', {}).get('root') or context.get('path')
-                    if git_root:
-                        terraform_path = Path(git_root) / 'terraform'
-                        has_terraform = terraform_path.exists()
-
-            elif '🚀 Deploy' in choice:
-                handle_deploy(context)
-
-            elif '🗑️ Delete' in choice:
-                handle_delete_project(context)
-
-            elif '🆕 Create new project' in choice:
-                handle_create_new_project()
-
-            elif '📁 Choose' in choice:
-                handle_choose_project()
-
-            elif '📥 Import' in choice:
-                handle_import_project()
+            handlers[action](context)
+            if context.get('_should_exit'):
+                break
 
-            elif 'Setup new client' in choice:
-                handle_setup_client()
+            # Refresh terraform status after generation
+            if action is MainMenuAction.GENERATE and terraform_path is not None:
+                has_terraform = exists_cached(terraform_path)
 
     except KeyboardInterrupt:
         # Ctrl+C pressed - exit gracefully
@@ -104,8 +100,6 @@ def interactive_mode(context: dict):
 
 def show_project_info(context: dict):
     """Display detected project information."""
-    from pathlib import Path
-
     table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column("Key", style="cyan")
     table.add_column("Value", style="white")
@@ -122,14 +116,12 @@ def show_project_info(context: dict):
         table.add_row("🌐 Domain", context['full_domain'])
 
     # Check for local terraform directory
-    terraform_path = Path.cwd() / 'terraform'
-    if terraform_path.exists():
+    if exists_cached(Path.cwd() / 'terraform'):
         table.add_row("✓ Terraform", "[green]Found[/green]")
     else:
         table.add_row("⚠ Terraform", "[yellow]Not found[/yellow]")
 
-    console.print(table)
-    console.print()
+    _print_section(table, "")
 
 
 def handle_add_services(context: dict):
@@ -146,9 +138,6 @@ def handle_add_services(context: dict):
 
 def handle_deploy(context: dict):
     """Handle deployment."""
-    from solvigo.commands.deploy import deploy_infrastructure
-    from pathlib import Path
-
     console.print("\n[cyan]═══ Deploy Infrastructure ═══[/cyan]\n")
 
     # Set terraform_path in context
@@ -165,9 +154,6 @@ def handle_deploy(context: dict):
 
 def handle_generate_infrastructure(context: dict):
     """Handle infrastructure generation for registered project."""
-    from solvigo.commands.init import generate_infrastructure_interactive
-    from pathlib import Path
-
     console.print("\n[cyan]═══ Generate Infrastructure ═══[/cyan]\n")
     console.print("[dim]This will create Terraform and CI/CD configuration files.[/dim]\n")
 
@@ -180,12 +166,15 @@ def handle_generate_infrastructure(context: dict):
         if git_root:
             terraform_path = Path(git_root) / 'terraform'
             context['terraform_path'] = terraform_path
-
-        console.print("\n[green bold]✨ Infrastructure generation complete![/green bold]\n")
-        console.print("Next steps:")
-        console.print("  1. Review generated files")
-        console.print("  2. Commit and push to GitHub")
-        console.print("  3. Run 'terraform init' and 'terraform apply'")
+            forget_cached_path(terraform_path)
+
+        _print_section(
+            "\n[green bold]✨ Infrastructure generation complete![/green bold]\n",
+            "Next steps:",
+            "  1. Review generated files",
+            "  2. Commit and push to GitHub",
+            "  3. Run 'terraform init' and 'terraform apply'"
+        )
     else:
         console.print("\n[red]✗ Infrastructure generation failed[/red]")
 
@@ -196,8 +185,6 @@ def handle_generate_infrastructure(context: dict):
 
 def handle_status(context: dict):
     """Handle status viewing."""
-    from solvigo.commands.status import show_status
-
     console.print("\n[cyan]═══ Project Status ═══[/cyan]\n")
     show_status(context)
 
@@ -206,32 +193,18 @@ def handle_status(context: dict):
         return
 
 
-def handle_configure(context: dict):
-    """Handle configuration."""
-    console.print("\n[cyan]═══ Configure Project ═══[/cyan]\n")
-    console.print("[yellow]Configuration options coming soon...[/yellow]")
-
-    console.print()
-    if confirm_action("Return to main menu?", default=True):
-        return
-
-
-def handle_create_new_project():
+def handle_create_new_project(context: dict):
     """Handle creating a new project."""
     console.print("\n[cyan]═══ Create New Project ═══[/cyan]\n")
-    interactive_create_project()
+    interactive_create_project(dev_mode=context.get('dev', False))
 
     console.print()
     if confirm_action("Return to main menu?", default=True):
         return
 
 
-def handle_choose_project():
+def handle_choose_project(context: dict):
     """Handle choosing an existing project."""
-    from solvigo.utils.context import list_all_clients, find_client_projects
-    from solvigo.ui.prompts import select_option
-    import os
-
     console.print("\n[cyan]═══ Choose Existing Project ═══[/cyan]\n")
 
     # List all clients
@@ -252,15 +225,13 @@ def handle_choose_project():
         console.print(f"[red]No projects found for {selected_client}.[/red]")
         return
 
-    # Let user select project
-    project_choices = [p['name'] for p in projects]
+    # Let user select project, then look up its directory by name
+    name_to_path = {p['name']: p['path'] for p in projects}
     selected_project = select_option(
         "Select project:",
-        choices=project_choices
+        choices=list(name_to_path)
     )
-
-    # Find the project directory
-    project_dir = next(p['path'] for p in projects if p['name'] == selected_project)
+    project_dir = name_to_path[selected_project]
 
     console.print(f"\n[green]✓[/green] Project: {selected_client}/{selected_project}")
     console.print(f"[dim]Location: {project_dir}[/dim]\n")
@@ -271,7 +242,7 @@ def handle_choose_project():
         console.print(f"  solvigo\n")
 
 
-def handle_import_project():
+def handle_import_project(context: dict):
     """Handle importing an existing GCP project."""
     console.print("\n[cyan]═══ Import Existing GCP Project ═══[/cyan]\n")
     interactive_import_project()
@@ -281,18 +252,6 @@ def handle_import_project():
         return
 
 
-def handle_setup_client():
-    """Handle setting up a new client."""
-    from solvigo.ui.prompts import text_input
-
-    console.print("\n[cyan]═══ Setup New Client ═══[/cyan]\n")
-
-    client_name = text_input("Client name (lowercase, hyphens only):")
-
-    console.print(f"\n[yellow]Setting up client: {client_name}[/yellow]")
-    console.print("[dim]This feature is coming soon...[/dim]\n")
-
-
 def handle_delete_project(context: dict):
     """Handle deleting project from registry."""
     console.print("\n[cyan]═══ Delete Project ═══[/cyan]\n")
@@ -302,8 +261,7 @@ def handle_delete_project(context: dict):
     if confirm_action("Are you sure you want to delete this project?", default=False):
         console.print("\n[yellow]Deleting project from registry...[/yellow]")
 
-        from solvigo.admin.client import AdminClient
-        registry = AdminClient(dev_mode=context.get('dev', False))
+        registry = get_admin_client(context.get('dev', False))
 
         # Use the actual project ID from the database (not constructed)
         # The project_data from the API has the correct ID
@@ -315,8 +273,9 @@ def handle_delete_project(context: dict):
             registry.delete_project(project_id)
             console.print(f"[green]✓ Project {project_id} deleted from registry.[/green]")
             console.print("[dim]You can now delete the local directory if desired.[/dim]\n")
-            # Exit after deletion as context is invalid
-            exit(0)
+            # Leave interactive mode after deletion as context is invalid
+            context['_should_exit'] = True
+            return
         except Exception as e:
             console.print(f"[red]✗ Failed to delete project: {e}[/red]\n")
     else:
@@ -336,9 +295,6 @@ def handle_register_current_project(context: dict):
     3. Create project with subdomain and display name
     4. Save to database via API
     """
-    from solvigo.ui.prompts import text_input, select_option
-    from solvigo.admin.client import AdminClient
-
     console.print("\n[cyan]═══ Register New Project ═══[/cyan]\n")
 
     # Get GitHub URL
@@ -347,15 +303,13 @@ def handle_register_current_project(context: dict):
         console.print("[red]Error: No git remote URL found[/red]")
         return
 
-    console.print(f"Repository: [cyan]{github_url}[/cyan]\n")
-
-    # Step 1: Link GCP Project
-    console.print("[bold]Step 1: Link GCP Project[/bold]\n")
-
-    # List available GCP projects
-    console.print("🔍 Listing your GCP projects...")
+    # Step 1: Link GCP Project, listing available GCP projects
+    _print_section(
+        f"Repository: [cyan]{github_url}[/cyan]\n",
+        "[bold]Step 1: Link GCP Project[/bold]\n",
+        "🔍 Listing your GCP projects..."
+    )
     try:
-        from solvigo.gcp.discovery import list_accessible_projects
         gcp_projects = list_accessible_projects()
 
         if not gcp_projects:
@@ -365,28 +319,28 @@ def handle_register_current_project(context: dict):
 
         console.print(f"[green]✓ Found {len(gcp_projects)} accessible projects[/green]\n")
 
+        # Lowercased search keys and labels, computed once per listing
+        index = build_search_index(gcp_projects)
+
         # Let user choose or search
         search_query = text_input("Search for project (or press Enter to browse all):")
 
         if search_query:
-            filtered = [p for p in gcp_projects if search_query.lower() in p['project_id'].lower() or search_query.lower() in p.get('name', '').lower()]
-            if filtered:
-                gcp_projects = filtered
-            else:
+            index = match_projects(index, search_query.lower())
+            if not index:
                 console.print(f"[yellow]No projects matching '{search_query}'[/yellow]")
                 return
 
         # Show projects and let user select
-        project_choices = [f"{p['project_id']} - {p.get('name', 'N/A')}" for p in gcp_projects[:20]]
-        project_choices.append("❌ Cancel")
+        project_choices = [(label, project['project_id']) for _, _, label, project in index[:20]]
+        project_choices.append(("❌ Cancel", None))
 
-        selected = select_option("Select GCP project:", choices=project_choices)
+        gcp_project_id = select_option("Select GCP project:", choices=project_choices)
 
-        if "❌ Cancel" in selected:
+        if gcp_project_id is None:
             console.print("\n[dim]Cancelled.[/dim]\n")
             return
 
-        gcp_project_id = selected.split(' - ')[0]
         console.print(f"\n[green]✓ Selected: {gcp_project_id}[/green]\n")
 
     except Exception as e:
@@ -397,7 +351,7 @@ def handle_register_current_project(context: dict):
     # Step 2: Choose or Create Client
     console.print("[bold]Step 2: Choose or Create Client[/bold]\n")
 
-    registry = AdminClient(dev_mode=context.get('dev', False))
+    registry = get_admin_client(context.get('dev', False))
 
     try:
         clients = registry.list_clients()
@@ -406,17 +360,17 @@ def handle_register_current_project(context: dict):
         console.print(f"[yellow]⚠ Could not list clients: {e}[/yellow]")
         clients = []
 
-    client_choices = [f"{c['name']} ({c['id']})" for c in clients]
-    client_choices.append("➕ Create new client")
-    client_choices.append("❌ Cancel")
+    client_choices = [(f"{c['name']} ({c['id']})", c) for c in clients]
+    client_choices.append(("➕ Create new client", NEW_CLIENT))
+    client_choices.append(("❌ Cancel", None))
 
-    client_choice = select_option("Select client:", choices=client_choices)
+    client = select_option("Select client:", choices=client_choices)
 
-    if "❌ Cancel" in client_choice:
+    if client is None:
         console.print("\n[dim]Cancelled.[/dim]\n")
         return
 
-    if "➕ Create new client" in client_choice:
+    if client == NEW_CLIENT:
         # Create new client
         console.print("\n[cyan]Creating new client...[/cyan]\n")
 
@@ -437,14 +391,9 @@ def handle_register_current_project(context: dict):
             console.print(f"[red]✗ Failed to create client: {e}[/red]")
             return
     else:
-        # Use existing client - fetch full details to get subdomain
-        client_id = client_choice.split('(')[1].rstrip(')')
-        try:
-            client_details = registry.get_client(client_id)
-            client_subdomain = client_details['subdomain']
-        except Exception as e:
-            console.print(f"[red]✗ Failed to fetch client details: {e}[/red]")
-            return
+        # The client list already carries the subdomain
+        client_id = client['id']
+        client_subdomain = client['subdomain']
 
     # Step 3: Create Project
     console.print("[bold]Step 3: Create Project[/bold]\n")
@@ -476,20 +425,21 @@ def handle_register_current_project(context: dict):
 
         registry.register_project(project_data)
 
-        console.print(Panel(
-            f"[green]✓ Project registered successfully![/green]\n\n"
-            f"Project ID: [cyan]{project_id}[/cyan]\n"
-            f"Client: [cyan]{client_id}[/cyan]\n"
-            f"GCP Project: [cyan]{gcp_project_id}[/cyan]\n"
-            f"Domain: [cyan]{full_domain}[/cyan]\n"
-            f"Repository: [cyan]{github_url}[/cyan]\n\n"
-            f"[dim]You can now use the Solvigo CLI to manage this project.[/dim]",
-            title="🎉 Registration Complete",
-            border_style="green"
-        ))
-        console.print()
-
-        console.print("[yellow]Tip:[/yellow] Run [cyan]solvigo --dev[/cyan] again to reload the project context.\n")
+        _print_section(
+            Panel(
+                f"[green]✓ Project registered successfully![/green]\n\n"
+                f"Project ID: [cyan]{project_id}[/cyan]\n"
+                f"Client: [cyan]{client_id}[/cyan]\n"
+                f"GCP Project: [cyan]{gcp_project_id}[/cyan]\n"
+                f"Domain: [cyan]{full_domain}[/cyan]\n"
+                f"Repository: [cyan]{github_url}[/cyan]\n\n"
+                f"[dim]You can now use the Solvigo CLI to manage this project.[/dim]",
+                title="🎉 Registration Complete",
+                border_style="green"
+            ),
+            "",
+            "[yellow]Tip:[/yellow] Run [cyan]solvigo --dev[/cyan] again to reload the project context.\n"
+        )
 
     except Exception as e:
         console.print(f"[red]✗ Failed to register project: {e}[/red]")
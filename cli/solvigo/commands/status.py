@@ -1,9 +1,11 @@
 """
 Show project status
 """
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 
+from solvigo.utils.context import exists_cached
+
 console = Console()
 
 
@@ -17,8 +19,6 @@ def show_status(context: dict):
     client = context.get('client')
     project = context.get('project')
 
-    console.print(f"[bold]Status for {client}/{project}[/bold]\n")
-
     # Create status table
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("Component")
@@ -28,7 +28,7 @@ def show_status(context: dict):
     # Check terraform locally
     from pathlib import Path
     terraform_path = Path.cwd() / 'terraform'
-    if terraform_path.exists():
+    if exists_cached(terraform_path):
         table.add_row("Terraform", "[green]✓ Found[/green]", str(terraform_path))
     else:
         table.add_row("Terraform", "[red]✗ Not found[/red]", "-")
@@ -40,7 +40,10 @@ def show_status(context: dict):
     # - Load balancer registration
     # - DNS records
 
-    console.print(table)
-    console.print()
-
-    console.print("[yellow]⚠ Full status checking not yet implemented[/yellow]\n")
+    # Render the whole report in one console write
+    console.print(Group(
+        f"[bold]Status for {client}/{project}[/bold]\n",
+        table,
+        "",
+        "[yellow]⚠ Full status checking not yet implemented[/yellow]\n"
+    ))
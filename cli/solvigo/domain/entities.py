@@ -1,6 +1,6 @@
 """Domain entities for Solvigo CLI"""
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -12,7 +12,7 @@ class ProjectStatus(Enum):
     SUSPENDED = "suspended"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Environment:
     """Project environment (dev, prod, etc.)"""
     name: str
@@ -21,7 +21,7 @@ class Environment:
     requires_approval: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Service:
     """Cloud Run service configuration"""
     name: str
@@ -32,7 +32,7 @@ class Service:
     last_deployed_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectInfo:
     """Full project information from database"""
     id: str
@@ -42,8 +42,8 @@ class ProjectInfo:
     full_domain: Optional[str]
     github_repo: Optional[str]
     status: str
-    environments: List[Environment]
-    services: List[Service]
+    environments: Tuple[Environment, ...]
+    services: Tuple[Service, ...]
     gcp_region: Optional[str] = None
     terraform_state_bucket: Optional[str] = None
     last_deployed_at: Optional[datetime] = None
@@ -56,7 +56,7 @@ class ProjectInfo:
         return self.status == ProjectStatus.PENDING_BILLING.value
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GitRepoInfo:
     """Git repository information"""
     root: str
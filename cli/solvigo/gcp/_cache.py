@@ -0,0 +1,137 @@
+"""
+On-disk TTL cache for slow gcloud lookups, shared across CLI runs
+"""
+import configparser
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from solvigo.utils.cache_dir import CACHE_DIR
+
+CACHE_FILE = CACHE_DIR / 'gcp_access.json'
+GCLOUD_CONFIG_DIR = Path(os.getenv('CLOUDSDK_CONFIG', Path.home() / '.config' / 'gcloud'))
+
+# In-memory copy of CACHE_FILE, loaded on first use
+_entries: Optional[Dict[str, Dict]] = None
+# Guards _entries and CACHE_FILE; cached lookups run from discovery worker threads
+_lock = threading.Lock()
+# When set, cached entries are ignored (but fresh results are still stored)
+_refresh = bool(os.getenv('SOLVIGO_NO_CACHE'))
+
+
+def _active_account() -> str:
+    """Active gcloud account, read from gcloud's config files to avoid a subprocess"""
+    account = os.getenv('CLOUDSDK_CORE_ACCOUNT')
+    if account:
+        return account
+
+    try:
+        name = os.getenv('CLOUDSDK_ACTIVE_CONFIG_NAME') or (GCLOUD_CONFIG_DIR / 'active_config').read_text().strip()
+        parser = configparser.ConfigParser()
+        parser.read(GCLOUD_CONFIG_DIR / 'configurations' / f'config_{name or "default"}')
+        return parser.get('core', 'account', fallback='')
+    except (OSError, configparser.Error):
+        return ''
+
+
+def _load() -> Dict[str, Dict]:
+    """Load cache entries from disk once per CLI run"""
+    global _entries
+    if _entries is None:
+        try:
+            _entries = json.loads(CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            _entries = {}
+    return _entries
+
+
+def _save(entries: Dict[str, Dict]):
+    """Write unexpired entries back to disk (best-effort, user-readable only)"""
+    now = time.time()
+    live = {key: entry for key, entry in entries.items() if entry['expires_at'] > now}
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(live, f)
+    except OSError:
+        pass
+
+
+def _key(func: Callable, args: tuple, kwargs: dict) -> str:
+    """Cache key for a call: function name, active gcloud account and arguments"""
+    return json.dumps([func.__name__, _active_account(), args, sorted(kwargs.items())])
+
+
+def cached(ttl: int) -> Callable:
+    """
+    Cache truthy results of a gcloud lookup on disk for `ttl` seconds.
+
+    Entries are keyed by function name, arguments and the active gcloud
+    account, so switching accounts never reuses another account's answer.
+    Falsy results (failures, no access) are never cached. The wrapped
+    function gets a `forget(*args, **kwargs)` attribute that drops the
+    entry for those arguments after a change makes it stale.
+
+    Args:
+        ttl: Seconds a result stays valid
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _key(func, args, kwargs)
+            if not _refresh:
+                with _lock:
+                    entry = _load().get(key)
+                if entry and entry['expires_at'] > time.time():
+                    return entry['value']
+
+            value = func(*args, **kwargs)
+            if value:
+                with _lock:
+                    entries = _load()
+                    entries[key] = {'value': value, 'expires_at': time.time() + ttl}
+                    _save(entries)
+            return value
+
+        def forget(*args, **kwargs):
+            key = _key(func, args, kwargs)
+            with _lock:
+                entries = _load()
+                if entries.pop(key, None) is not None:
+                    _save(entries)
+
+        wrapper.forget = forget
+        return wrapper
+    return decorator
+
+
+def refresh():
+    """Ignore cached lookups for the rest of this run; fresh results are still stored"""
+    global _refresh
+    _refresh = True
+
+
+def clear() -> int:
+    """
+    Remove all cached lookups, including Admin API tokens and platform config.
+
+    Returns:
+        Number of cache files removed
+    """
+    global _entries
+    with _lock:
+        _entries = None
+
+    removed = 0
+    for path in CACHE_DIR.glob('*.json'):
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
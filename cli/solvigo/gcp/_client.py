@@ -0,0 +1,35 @@
+"""
+Direct Google Cloud REST access with application default credentials, for
+lookups where one HTTP request is cheaper than starting a gcloud subprocess
+"""
+import functools
+from typing import Optional
+
+CLOUD_PLATFORM_SCOPE = 'https://www.googleapis.com/auth/cloud-platform'
+
+
+@functools.lru_cache(maxsize=1)
+def authorized_session() -> Optional['AuthorizedSession']:
+    """
+    Session that signs requests with application default credentials.
+
+    Created once per CLI run so the credentials are refreshed only when they
+    expire and requests share keep-alive connections.
+
+    Returns:
+        AuthorizedSession, or None if google-auth is not installed or no
+        credentials are configured (callers then fall back to gcloud)
+    """
+    try:
+        import google.auth
+        from google.auth.exceptions import DefaultCredentialsError
+        from google.auth.transport.requests import AuthorizedSession
+    except ImportError:
+        return None
+
+    try:
+        credentials, _ = google.auth.default(scopes=[CLOUD_PLATFORM_SCOPE])
+    except DefaultCredentialsError:
+        return None
+
+    return AuthorizedSession(credentials)
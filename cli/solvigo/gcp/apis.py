@@ -2,13 +2,24 @@
 GCP API management - enable and track APIs for discovery and Terraform
 """
 import subprocess
-import json
+import time
 from typing import List, Set
 from rich.console import Console
 from rich.progress import Progress
+from rich.table import Table
+
+from solvigo.gcp._cache import cached
+from solvigo.gcp._client import authorized_session
+from solvigo.ui.prompts import confirm_action
+from solvigo.utils import fastjson
 
 console = Console()
 
+# Enabled-API listings are reused across CLI runs for this long
+ENABLED_APIS_TTL = 600
+
+SERVICE_USAGE_URL = 'https://serviceusage.googleapis.com/v1'
+
 
 # APIs required for resource discovery
 DISCOVERY_APIS = {
@@ -33,6 +44,21 @@ COMMON_APIS = {
     'cloudscheduler.googleapis.com': 'Cloud Scheduler',
 }
 
+# Default APIs that are auto-enabled (left out of Terraform)
+DEFAULT_APIS = frozenset({
+    'cloudapis.googleapis.com',
+    'clouddebugger.googleapis.com',
+    'cloudtrace.googleapis.com',
+    'datastore.googleapis.com',
+    'logging.googleapis.com',
+    'monitoring.googleapis.com',
+    'servicemanagement.googleapis.com',
+    'serviceusage.googleapis.com',
+    'sql-component.googleapis.com',
+    'storage-api.googleapis.com',
+    'storage-component.googleapis.com',
+})
+
 # APIs required for CI/CD (Cloud Build)
 CICD_APIS = {
     'cloudbuild.googleapis.com': 'Cloud Build',
@@ -51,6 +77,12 @@ def get_enabled_apis(project_id: str) -> Set[str]:
     Returns:
         Set of enabled API names
     """
+    return set(_list_enabled_apis(project_id))
+
+
+@cached(ttl=ENABLED_APIS_TTL)
+def _list_enabled_apis(project_id: str) -> List[str]:
+    """Enabled API names from gcloud, as a JSON-cacheable list (empty on failure)"""
     try:
         result = subprocess.run(
             [
@@ -60,20 +92,55 @@ def get_enabled_apis(project_id: str) -> Set[str]:
                 '--format=json',
                 '--verbosity=error'
             ],
-            capture_output=True,
-            text=True,
+            capture_output=True,  # Bytes: the JSON parser decodes them itself
             check=False,
             timeout=30
         )
 
         if result.returncode != 0:
-            return set()
+            return []
 
-        services = json.loads(result.stdout) if result.stdout else []
-        return {service.get('config', {}).get('name', '') for service in services}
+        services = fastjson.loads(result.stdout) if result.stdout else []
+        return [service.get('config', {}).get('name', '') for service in services]
 
     except Exception:
-        return set()
+        return []
+
+
+def get_enabled_apis_among(project_id: str, apis: List[str]) -> Set[str]:
+    """
+    Check which of the given APIs are enabled in a project.
+
+    Asks the Service Usage batchGet endpoint about just these APIs instead of
+    listing every enabled service through gcloud. Falls back to the full
+    gcloud listing if no credentials are available or the request fails.
+
+    Args:
+        project_id: GCP project ID
+        apis: API names to check (at most 20, the batchGet limit)
+
+    Returns:
+        Set of the given API names that are enabled
+    """
+    session = authorized_session()
+    if session is None:
+        return get_enabled_apis(project_id) & set(apis)
+
+    try:
+        response = session.get(
+            f'{SERVICE_USAGE_URL}/projects/{project_id}/services:batchGet',
+            params={'names': [f'projects/{project_id}/services/{api}' for api in apis]},
+            timeout=10
+        )
+        response.raise_for_status()
+    except Exception:
+        return get_enabled_apis(project_id) & set(apis)
+
+    return {
+        service['config']['name']
+        for service in fastjson.loads(response.content).get('services', [])
+        if service.get('state') == 'ENABLED'
+    }
 
 
 def enable_apis(project_id: str, apis: List[str]) -> bool:
@@ -107,6 +174,7 @@ def enable_apis(project_id: str, apis: List[str]) -> bool:
         )
 
         if result.returncode == 0:
+            _list_enabled_apis.forget(project_id)
             console.print(f"[green]✓ APIs enabled successfully[/green]\n")
             return True
         else:
@@ -131,23 +199,17 @@ def ensure_discovery_apis(project_id: str) -> dict:
 
     Returns:
         dict with:
-            - enabled_apis: Set of APIs that were already enabled
+            - enabled_apis: Set of discovery APIs that were already enabled
             - newly_enabled: List of APIs that were just enabled
             - failed: List of APIs that failed to enable
     """
-    from rich.table import Table
-    from solvigo.ui.prompts import confirm_action
-
     console.print(f"\n[cyan]Checking required APIs for {project_id}...[/cyan]")
 
-    # Get currently enabled APIs
-    enabled = get_enabled_apis(project_id)
+    # Get currently enabled discovery APIs
+    enabled = get_enabled_apis_among(project_id, list(DISCOVERY_APIS))
 
     # Check which discovery APIs are missing
-    missing = []
-    for api, name in DISCOVERY_APIS.items():
-        if api not in enabled:
-            missing.append((api, name))
+    missing = [(api, name) for api, name in DISCOVERY_APIS.items() if api not in enabled]
 
     if not missing:
         console.print("[green]✓ All required APIs are already enabled[/green]\n")
@@ -201,11 +263,11 @@ def ensure_discovery_apis(project_id: str) -> dict:
         )
 
         if result.returncode == 0:
+            _list_enabled_apis.forget(project_id)
             console.print("[green]✓ APIs enabled successfully[/green]\n")
             console.print("[dim]Waiting for APIs to propagate...[/dim]")
 
             # Wait for APIs to propagate
-            import time
             time.sleep(5)
 
             return {
@@ -251,22 +313,5 @@ def get_project_apis_for_terraform(project_id: str) -> List[str]:
     Returns:
         List of API names to include in Terraform
     """
-    enabled = get_enabled_apis(project_id)
-
-    # Default APIs that are auto-enabled (skip these)
-    default_apis = {
-        'cloudapis.googleapis.com',
-        'clouddebugger.googleapis.com',
-        'cloudtrace.googleapis.com',
-        'datastore.googleapis.com',
-        'logging.googleapis.com',
-        'monitoring.googleapis.com',
-        'servicemanagement.googleapis.com',
-        'serviceusage.googleapis.com',
-        'sql-component.googleapis.com',
-        'storage-api.googleapis.com',
-        'storage-component.googleapis.com',
-    }
-
     # Return only non-default APIs
-    return sorted([api for api in enabled if api not in default_apis])
+    return sorted(get_enabled_apis(project_id) - DEFAULT_APIS)
@@ -3,18 +3,82 @@ GCP Resource Discovery - scan projects for existing resources
 """
 import subprocess
 import json
-from typing import Dict, List, Optional
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 from rich.console import Console
 from rich.progress import Progress
 
+from solvigo.gcp._cache import cached
+from solvigo.utils import fastjson
+
 console = Console()
 
+# Access checks and project listings are reused across CLI runs for this long
+GCP_ACCESS_TTL = 300
+# Discovered resources are reused across CLI runs for this long
+DISCOVERY_TTL = 600
+
+# Google-managed service accounts that are never imported
+DEFAULT_SERVICE_ACCOUNT_MARKERS = ('@cloudservices', '@compute-system', '@gcp-sa-')
+_DEFAULT_SERVICE_ACCOUNT_RE = re.compile('|'.join(map(re.escape, DEFAULT_SERVICE_ACCOUNT_MARKERS)))
+
+# Attempts per discovery call when gcloud fails with a transient control-plane error
+GCLOUD_ATTEMPTS = 3
+_TRANSIENT_GCLOUD_ERROR_RE = re.compile(r'\b(429|503)\b|unavailable|deadline|rate limit', re.IGNORECASE)
+
+# Env var name fragments that mark a Cloud Run service as frontend or backend
+FRONTEND_ENV_MARKERS = ('REACT_APP_', 'VITE_', 'NEXT_PUBLIC_', 'VUE_APP_')
+BACKEND_ENV_MARKERS = ('DATABASE_URL', 'REDIS_URL', 'SQLALCHEMY', 'DJANGO_SETTINGS', 'FASTAPI')
+# One compiled alternation per side, so each env name is scanned once rather than per marker
+_FRONTEND_ENV_RE = re.compile('|'.join(map(re.escape, FRONTEND_ENV_MARKERS)))
+_BACKEND_ENV_RE = re.compile('|'.join(map(re.escape, BACKEND_ENV_MARKERS)))
+
 
 class ResourceDiscovery:
     """Discovers resources in a GCP project"""
 
-    def __init__(self, project_id: str):
+    def __init__(self, project_id: str, enabled_apis: Optional[Set[str]] = None):
+        """
+        Args:
+            project_id: GCP project ID
+            enabled_apis: Discovery APIs known to be enabled (see ensure_discovery_apis).
+                Fetched from gcloud on first scan if not given.
+        """
         self.project_id = project_id
+        self.enabled_apis = enabled_apis
+
+    # Resource type -> (discover method name, label shown when it fails)
+    DISCOVERERS = {
+        'cloud_run': ('discover_cloud_run', 'Cloud Run'),
+        'cloud_sql': ('discover_cloud_sql', 'Cloud SQL'),
+        'firestore': ('discover_firestore', None),
+        'storage': ('discover_storage_buckets', 'Storage'),
+        'secrets': ('discover_secrets', 'Secrets'),
+        'service_accounts': ('discover_service_accounts', None),
+        'vpc_connectors': ('discover_vpc_connectors', None),
+        'apis': ('discover_enabled_apis', None),
+    }
+
+    # Resource type -> API its gcloud call needs; types whose API is disabled are skipped
+    REQUIRED_APIS = {
+        'cloud_run': 'run.googleapis.com',
+        'cloud_sql': 'sqladmin.googleapis.com',
+        'firestore': 'firestore.googleapis.com',
+        'storage': 'storage.googleapis.com',
+        'secrets': 'secretmanager.googleapis.com',
+        'service_accounts': 'iam.googleapis.com',
+    }
+
+    # Resource type -> (gcloud list command, field identifying each item) for types
+    # that summaries only count
+    COUNT_COMMANDS = {
+        'storage': (['storage', 'buckets', 'list'], 'name'),
+        'secrets': (['secrets', 'list'], 'name'),
+        'service_accounts': (['iam', 'service-accounts', 'list'], 'email'),
+    }
 
     def discover_all(self) -> Dict[str, List[Dict]]:
         """
@@ -25,405 +89,246 @@ class ResourceDiscovery:
         """
         console.print(f"\n🔍 Scanning GCP project: [cyan]{self.project_id}[/cyan]...")
 
-        resources = {}
-
-        # Note: We wrap each discovery in try/except to handle timeouts gracefully
-        # If an API isn't enabled, gcloud will prompt for confirmation which causes timeout
+        found = dict(self.iter_discovered())
 
-        with Progress() as progress:
-            task = progress.add_task("[cyan]Discovering resources...", total=8)
+        # Keep a stable order regardless of which call finished first
+        resources = {key: found[key] for key in self.DISCOVERERS}
 
-            # Cloud Run services
-            try:
-                resources['cloud_run'] = self.discover_cloud_run()
-            except Exception as e:
-                console.print(f"[dim]Skipping Cloud Run (API may not be enabled)[/dim]")
-                resources['cloud_run'] = []
-            progress.advance(task)
+        # Print summary
+        self._print_discovery_summary(resources)
 
-            # Cloud SQL instances
-            try:
-                resources['cloud_sql'] = self.discover_cloud_sql()
-            except Exception as e:
-                console.print(f"[dim]Skipping Cloud SQL (API may not be enabled)[/dim]")
-                resources['cloud_sql'] = []
-            progress.advance(task)
+        return resources
 
-            # Firestore
-            try:
-                resources['firestore'] = self.discover_firestore()
-            except Exception as e:
-                resources['firestore'] = []
-            progress.advance(task)
+    def iter_discovered(self, summary: bool = False) -> Iterator[Tuple[str, Union[List[Dict], int]]]:
+        """
+        Discover all supported resources, yielding each type as soon as it is found.
 
-            # Storage buckets
-            try:
-                resources['storage'] = self.discover_storage_buckets()
-            except Exception as e:
-                console.print(f"[dim]Skipping Storage (API may not be enabled)[/dim]")
-                resources['storage'] = []
-            progress.advance(task)
+        Args:
+            summary: Only count the types in COUNT_COMMANDS instead of listing them
 
-            # Secrets
-            try:
-                resources['secrets'] = self.discover_secrets()
-            except Exception as e:
-                console.print(f"[dim]Skipping Secrets (API may not be enabled)[/dim]")
-                resources['secrets'] = []
-            progress.advance(task)
+        Yields:
+            (resource type, list of resources) tuples in completion order. In summary
+            mode the count-only types yield their count instead of a list.
+        """
+        # Note: We wrap each discovery in try/except to handle timeouts gracefully
+        # If an API isn't enabled, gcloud will prompt for confirmation which causes timeout
+        # Each discovery is an independent gcloud call, so they all run concurrently
+        if self.enabled_apis is None:
+            from solvigo.gcp.apis import get_enabled_apis
+            self.enabled_apis = get_enabled_apis(self.project_id)
 
-            # Service accounts
-            try:
-                resources['service_accounts'] = self.discover_service_accounts()
-            except Exception as e:
-                resources['service_accounts'] = []
-            progress.advance(task)
+        with Progress() as progress:
+            task = progress.add_task("[cyan]Discovering resources...", total=len(self.DISCOVERERS))
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {}
+                for key in self.DISCOVERERS:
+                    counted = summary and key in self.COUNT_COMMANDS
+                    api = self.REQUIRED_APIS.get(key)
+                    # An empty set means the lookup failed, so nothing is skipped
+                    if self.enabled_apis and api and api not in self.enabled_apis:
+                        progress.advance(task)
+                        yield key, 0 if counted else []
+                        continue
+                    futures[executor.submit(_discover, self.project_id, key, counted)] = key
+
+                for future in as_completed(futures):
+                    key = futures[future]
+                    try:
+                        items = future.result()
+                    except Exception:
+                        label = self.DISCOVERERS[key][1]
+                        if label:
+                            console.print(f"[dim]Skipping {label} (API may not be enabled)[/dim]")
+                        items = 0 if summary and key in self.COUNT_COMMANDS else []
+                    progress.advance(task)
+                    yield key, items
+
+    def count_resources(self, resource_type: str) -> int:
+        """
+        Count resources of one type without fetching and parsing their full JSON.
 
-            # VPC connectors
-            try:
-                resources['vpc_connectors'] = self.discover_vpc_connectors()
-            except Exception as e:
-                resources['vpc_connectors'] = []
-            progress.advance(task)
+        Args:
+            resource_type: Resource type key from COUNT_COMMANDS
 
-            # Enabled APIs
-            try:
-                resources['apis'] = self.discover_enabled_apis()
-            except Exception as e:
-                resources['apis'] = []
-            progress.advance(task)
+        Returns:
+            Number of resources (0 if the API is not available)
+        """
+        command, field = self.COUNT_COMMANDS[resource_type]
+        result = subprocess.run(
+            [
+                'gcloud', *command,
+                f'--project={self.project_id}',
+                f'--format=value({field})',
+                '--verbosity=error'
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=10
+        )
 
-        # Print summary
-        self._print_discovery_summary(resources)
+        if result.returncode != 0:
+            return 0
 
-        return resources
+        values = result.stdout.split()
+        if resource_type == 'service_accounts':
+            # Match discover_service_accounts(), which leaves out default accounts
+            values = [v for v in values if not _DEFAULT_SERVICE_ACCOUNT_RE.search(v)]
+        return len(values)
 
-    def discover_cloud_run(self) -> List[Dict]:
-        """Discover Cloud Run services"""
-        try:
-            result = subprocess.run(
-                [
-                    'gcloud', 'run', 'services', 'list',
-                    f'--project={self.project_id}',
-                    '--format=json',
-                    '--verbosity=error'  # Suppress prompts
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=10  # 10 second timeout (faster failure)
-            )
-
-            # Check if command failed
-            if result.returncode != 0:
-                # API might not be enabled, just return empty
-                return []
+    def _run_gcloud_json(self, args: List[str], fields: str = '', label: Optional[str] = None) -> List[Dict]:
+        """
+        Run a gcloud list command against this project and parse its JSON output.
 
-            services = json.loads(result.stdout) if result.stdout else []
+        Args:
+            args: gcloud arguments, e.g. ['sql', 'instances', 'list']
+            fields: Optional projection so gcloud only returns these fields
+            label: Name shown in the warning if the call times out
 
-            # Enhance with metadata
-            enhanced = []
-            for service in services:
-                enhanced.append({
-                    'name': service.get('metadata', {}).get('name'),
-                    'region': service.get('metadata', {}).get('labels', {}).get('cloud.googleapis.com/location'),
-                    'url': service.get('status', {}).get('url'),
-                    'image': service.get('spec', {}).get('template', {}).get('spec', {}).get('containers', [{}])[0].get('image'),
-                    'type': self._classify_cloud_run_service(service),
-                    'raw': service
-                })
+        Returns:
+            Parsed list, or [] if the call fails (e.g. the API is not enabled)
+        """
+        for attempt in range(GCLOUD_ATTEMPTS):
+            try:
+                result = subprocess.run(
+                    [
+                        'gcloud', *args,
+                        f'--project={self.project_id}',
+                        f'--format=json({fields})' if fields else '--format=json',
+                        '--verbosity=error'  # Suppress prompts
+                    ],
+                    capture_output=True,  # Bytes: the JSON parser decodes them itself
+                    check=False,
+                    timeout=10  # 10 second timeout (faster failure)
+                )
+            except subprocess.TimeoutExpired:
+                if label:
+                    console.print(f"[yellow]⚠ {label} discovery timed out[/yellow]")
+                return []
 
-            return enhanced
+            # Retry rate limits and brief outages with jittered backoff
+            if result.returncode == 0 or not _TRANSIENT_GCLOUD_ERROR_RE.search(result.stderr.decode(errors='replace')):
+                break
+            if attempt < GCLOUD_ATTEMPTS - 1:
+                time.sleep(0.3 * 2 ** attempt + random.uniform(0, 0.1))
 
-        except subprocess.CalledProcessError:
+        # API might not be enabled, just return empty
+        if result.returncode != 0 or not result.stdout:
             return []
+
+        try:
+            return fastjson.loads(result.stdout)
         except json.JSONDecodeError:
             return []
 
+    def discover_cloud_run(self) -> List[Dict]:
+        """Discover Cloud Run services"""
+        services = self._run_gcloud_json(['run', 'services', 'list'], label='Cloud Run')
+
+        # Enhance with metadata
+        return [
+            {
+                'name': service.get('metadata', {}).get('name'),
+                'region': service.get('metadata', {}).get('labels', {}).get('cloud.googleapis.com/location'),
+                'url': service.get('status', {}).get('url'),
+                'image': service.get('spec', {}).get('template', {}).get('spec', {}).get('containers', [{}])[0].get('image'),
+                'type': self._classify_cloud_run_service(service)
+            }
+            for service in services
+        ]
+
     def discover_cloud_sql(self) -> List[Dict]:
         """Discover Cloud SQL instances"""
-        try:
-            result = subprocess.run(
-                [
-                    'gcloud', 'sql', 'instances', 'list',
-                    f'--project={self.project_id}',
-                    '--format=json',
-                    '--verbosity=error'
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=10
-            )
-
-            if result.returncode != 0:
-                return []
-
-            instances = json.loads(result.stdout) if result.stdout else []
-
-            enhanced = []
-            for instance in instances:
-                enhanced.append({
-                    'name': instance.get('name'),
-                    'database_version': instance.get('databaseVersion'),
-                    'tier': instance.get('settings', {}).get('tier'),
-                    'region': instance.get('region'),
-                    'state': instance.get('state'),
-                    'raw': instance
-                })
-
-            return enhanced
+        instances = self._run_gcloud_json(
+            ['sql', 'instances', 'list'],
+            fields='name,databaseVersion,settings.tier,region,state',
+            label='Cloud SQL'
+        )
 
-        except subprocess.TimeoutExpired:
-            console.print("[yellow]⚠ Cloud SQL discovery timed out[/yellow]")
-            return []
-        except subprocess.CalledProcessError:
-            return []
-        except json.JSONDecodeError:
-            return []
-        except Exception as e:
-            console.print(f"[yellow]⚠ Error discovering Cloud SQL: {e}[/yellow]")
-            return []
+        return [
+            {
+                'name': instance.get('name'),
+                'database_version': instance.get('databaseVersion'),
+                'tier': instance.get('settings', {}).get('tier'),
+                'region': instance.get('region'),
+                'state': instance.get('state')
+            }
+            for instance in instances
+        ]
 
     def discover_firestore(self) -> List[Dict]:
         """Check if Firestore is enabled"""
-        try:
-            result = subprocess.run(
-                [
-                    'gcloud', 'firestore', 'databases', 'list',
-                    f'--project={self.project_id}',
-                    '--format=json',
-                    '--verbosity=error'
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=10
-            )
-
-            if result.returncode == 0 and result.stdout:
-                databases = json.loads(result.stdout)
-                return [{'name': db.get('name'), 'type': 'firestore', 'raw': db} for db in databases]
-
-            return []
-
-        except (subprocess.CalledProcessError, json.JSONDecodeError):
-            return []
+        databases = self._run_gcloud_json(['firestore', 'databases', 'list'])
+        return [{'name': db.get('name'), 'type': 'firestore'} for db in databases]
 
     def discover_storage_buckets(self) -> List[Dict]:
         """Discover Cloud Storage buckets"""
-        try:
-            result = subprocess.run(
-                [
-                    'gcloud', 'storage', 'buckets', 'list',
-                    f'--project={self.project_id}',
-                    '--format=json',
-                    '--verbosity=error'
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=10
-            )
-
-            if result.returncode != 0:
-                return []
-
-            buckets = json.loads(result.stdout) if result.stdout else []
-
-            enhanced = []
-            for bucket in buckets:
-                name = bucket.get('name', '')
-                enhanced.append({
-                    'name': name,
-                    'location': bucket.get('location'),
-                    'storage_class': bucket.get('storageClass'),
-                    'is_terraform_state': 'terraform-state' in name,
-                    'raw': bucket
-                })
-
-            return enhanced
+        buckets = self._run_gcloud_json(
+            ['storage', 'buckets', 'list'],
+            fields='name,location,storageClass',
+            label='Storage'
+        )
 
-        except subprocess.TimeoutExpired:
-            console.print("[yellow]⚠ Storage discovery timed out[/yellow]")
-            return []
-        except subprocess.CalledProcessError:
-            return []
-        except json.JSONDecodeError:
-            return []
-        except Exception as e:
-            console.print(f"[yellow]⚠ Error discovering storage: {e}[/yellow]")
-            return []
+        return [
+            {
+                'name': bucket.get('name', ''),
+                'location': bucket.get('location'),
+                'storage_class': bucket.get('storageClass'),
+                'is_terraform_state': 'terraform-state' in bucket.get('name', '')
+            }
+            for bucket in buckets
+        ]
 
     def discover_secrets(self) -> List[Dict]:
         """Discover Secret Manager secrets"""
-        try:
-            result = subprocess.run(
-                [
-                    'gcloud', 'secrets', 'list',
-                    f'--project={self.project_id}',
-                    '--format=json',
-                    '--verbosity=error'
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=10
-            )
-
-            if result.returncode != 0:
-                return []
-
-            secrets = json.loads(result.stdout) if result.stdout else []
+        secrets = self._run_gcloud_json(['secrets', 'list'], fields='name,createTime', label='Secrets')
 
-            enhanced = []
-            for secret in secrets:
-                enhanced.append({
-                    'name': secret.get('name').split('/')[-1],  # Extract name from full path
-                    'created': secret.get('createTime'),
-                    'raw': secret
-                })
-
-            return enhanced
-
-        except subprocess.TimeoutExpired:
-            console.print("[yellow]⚠ Secrets discovery timed out[/yellow]")
-            return []
-        except subprocess.CalledProcessError:
-            return []
-        except json.JSONDecodeError:
-            return []
-        except Exception as e:
-            console.print(f"[yellow]⚠ Error discovering secrets: {e}[/yellow]")
-            return []
+        return [
+            {
+                'name': secret.get('name').split('/')[-1],  # Extract name from full path
+                'created': secret.get('createTime')
+            }
+            for secret in secrets
+        ]
 
     def discover_service_accounts(self) -> List[Dict]:
         """Discover service accounts"""
-        try:
-            result = subprocess.run(
-                [
-                    'gcloud', 'iam', 'service-accounts', 'list',
-                    f'--project={self.project_id}',
-                    '--format=json',
-                    '--verbosity=error'
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=10
-            )
-
-            if result.returncode != 0:
-                return []
-
-            accounts = json.loads(result.stdout) if result.stdout else []
-
-            # Filter out default GCP service accounts
-            filtered = []
-            for account in accounts:
-                email = account.get('email', '')
-                # Skip default accounts
-                if not any(skip in email for skip in ['@cloudservices', '@compute-system', '@gcp-sa-']):
-                    filtered.append({
-                        'email': email,
-                        'display_name': account.get('displayName'),
-                        'raw': account
-                    })
-
-            return filtered
+        accounts = self._run_gcloud_json(
+            ['iam', 'service-accounts', 'list'],
+            fields='email,displayName',
+            label='Service accounts'
+        )
 
-        except subprocess.TimeoutExpired:
-            console.print("[yellow]⚠ Service accounts discovery timed out[/yellow]")
-            return []
-        except subprocess.CalledProcessError:
-            return []
-        except json.JSONDecodeError:
-            return []
-        except Exception as e:
-            console.print(f"[yellow]⚠ Error discovering service accounts: {e}[/yellow]")
-            return []
+        # Filter out default GCP service accounts
+        return [
+            {
+                'email': account.get('email', ''),
+                'display_name': account.get('displayName')
+            }
+            for account in accounts
+            if not _DEFAULT_SERVICE_ACCOUNT_RE.search(account.get('email', ''))
+        ]
 
     def discover_vpc_connectors(self) -> List[Dict]:
         """Discover VPC Access connectors"""
-        try:
-            result = subprocess.run(
-                [
-                    'gcloud', 'compute', 'networks', 'vpc-access', 'connectors', 'list',
-                    f'--project={self.project_id}',
-                    '--format=json',
-                    '--verbosity=error'
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=10
-            )
-
-            if result.returncode == 0 and result.stdout:
-                connectors = json.loads(result.stdout)
-                return [{'name': c.get('name'), 'region': c.get('region'), 'raw': c} for c in connectors]
-
-            return []
-
-        except (subprocess.CalledProcessError, json.JSONDecodeError):
-            return []
+        connectors = self._run_gcloud_json(['compute', 'networks', 'vpc-access', 'connectors', 'list'])
+        return [{'name': c.get('name'), 'region': c.get('region')} for c in connectors]
 
     def discover_enabled_apis(self) -> List[Dict]:
         """Discover enabled GCP APIs"""
-        try:
-            result = subprocess.run(
-                [
-                    'gcloud', 'services', 'list',
-                    '--enabled',
-                    f'--project={self.project_id}',
-                    '--format=json',
-                    '--verbosity=error'
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=10
-            )
-
-            if result.returncode != 0:
-                return []
-
-            services = json.loads(result.stdout) if result.stdout else []
-
-            # Filter to interesting APIs
-            interesting_apis = {
-                'aiplatform.googleapis.com': 'Vertex AI',
-                'bigquery.googleapis.com': 'BigQuery',
-                'pubsub.googleapis.com': 'Pub/Sub',
-                'translate.googleapis.com': 'Translation API',
-                'vision.googleapis.com': 'Vision API',
-                'language.googleapis.com': 'Natural Language API',
-                'cloudtasks.googleapis.com': 'Cloud Tasks',
-                'cloudscheduler.googleapis.com': 'Cloud Scheduler',
-            }
+        from solvigo.gcp.apis import COMMON_APIS, get_enabled_apis
 
-            filtered = []
-            for service in services:
-                name = service.get('config', {}).get('name', '')
-                if name in interesting_apis:
-                    filtered.append({
-                        'name': name,
-                        'title': interesting_apis[name],
-                        'raw': service
-                    })
+        # Reuses the (cached) name list from apis.py instead of parsing every
+        # enabled service's full JSON config a second time
+        enabled = get_enabled_apis(self.project_id)
 
-            return filtered
-
-        except subprocess.TimeoutExpired:
-            console.print("[yellow]⚠ API discovery timed out[/yellow]")
-            return []
-        except subprocess.CalledProcessError:
-            return []
-        except json.JSONDecodeError:
-            return []
-        except Exception as e:
-            console.print(f"[yellow]⚠ Error discovering APIs: {e}[/yellow]")
-            return []
+        # Filter to interesting APIs
+        return [
+            {'name': name, 'title': title}
+            for name, title in COMMON_APIS.items()
+            if name in enabled
+        ]
 
     def _classify_cloud_run_service(self, service: Dict) -> str:
         """
@@ -443,13 +348,8 @@ class ResourceDiscovery:
         env_vars = containers[0].get('env', [])
         env_names = [env.get('name', '') for env in env_vars]
 
-        # Frontend indicators
-        frontend_indicators = ['REACT_APP_', 'VITE_', 'NEXT_PUBLIC_', 'VUE_APP_']
-        # Backend indicators
-        backend_indicators = ['DATABASE_URL', 'REDIS_URL', 'SQLALCHEMY', 'DJANGO_SETTINGS', 'FASTAPI']
-
-        frontend_score = sum(1 for env in env_names if any(ind in env for ind in frontend_indicators))
-        backend_score = sum(1 for env in env_names if any(ind in env for ind in backend_indicators))
+        frontend_score = sum(1 for env in env_names if _FRONTEND_ENV_RE.search(env))
+        backend_score = sum(1 for env in env_names if _BACKEND_ENV_RE.search(env))
 
         if frontend_score > backend_score:
             return 'frontend'
@@ -486,21 +386,38 @@ class ResourceDiscovery:
         console.print()
 
 
-def list_accessible_projects() -> List[Dict[str, str]]:
+@cached(ttl=DISCOVERY_TTL)
+def _discover(project_id: str, resource_type: str, count_only: bool) -> Union[List[Dict], int]:
+    """Run one ResourceDiscovery discoverer, cached so repeated scans of a project reuse it"""
+    discovery = ResourceDiscovery(project_id)
+    if count_only:
+        return discovery.count_resources(resource_type)
+    return getattr(discovery, ResourceDiscovery.DISCOVERERS[resource_type][0])()
+
+
+@cached(ttl=GCP_ACCESS_TTL)
+def list_accessible_projects(state: Optional[str] = 'ACTIVE') -> List[Dict[str, str]]:
     """
-    List all GCP projects the user has access to.
+    List GCP projects the user has access to.
+
+    Args:
+        state: Only return projects in this lifecycle state (None for all).
+            The filter is applied by the Resource Manager API, not locally.
 
     Returns:
         List of dicts with project_id, name, and parent info
     """
+    command = [
+        'gcloud', 'projects', 'list',
+        '--format=json(projectId,name,projectNumber,lifecycleState,parent)'
+    ]
+    if state:
+        command.append(f'--filter=lifecycleState:{state}')
+
     try:
         result = subprocess.run(
-            [
-                'gcloud', 'projects', 'list',
-                '--format=json'
-            ],
-            capture_output=True,
-            text=True,
+            command,
+            capture_output=True,  # Bytes: the JSON parser decodes them itself
             check=False,
             timeout=30
         )
@@ -508,7 +425,7 @@ def list_accessible_projects() -> List[Dict[str, str]]:
         if result.returncode != 0:
             return []
 
-        projects = json.loads(result.stdout) if result.stdout else []
+        projects = fastjson.loads(result.stdout) if result.stdout else []
 
         # Extract relevant info
         project_list = []
@@ -533,6 +450,7 @@ def list_accessible_projects() -> List[Dict[str, str]]:
         return []
 
 
+@cached(ttl=GCP_ACCESS_TTL)
 def verify_gcp_project_access(project_id: str) -> bool:
     """
     Verify that we have access to the GCP project.
@@ -547,7 +465,6 @@ def verify_gcp_project_access(project_id: str) -> bool:
         result = subprocess.run(
             ['gcloud', 'projects', 'describe', project_id],
             capture_output=True,
-            text=True,
             check=True
         )
         return result.returncode == 0
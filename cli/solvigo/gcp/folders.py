@@ -2,13 +2,122 @@
 GCP Folder management - create client folders and organize projects
 """
 import subprocess
-import json
-from typing import Optional
+import time
+from typing import Dict, List, Optional, Tuple
 from rich.console import Console
+from solvigo.gcp._client import authorized_session
 from solvigo.ui.prompts import confirm_action
+from solvigo.utils import fastjson
 
 console = Console()
 
+RESOURCE_MANAGER_URL = 'https://cloudresourcemanager.googleapis.com'
+
+# Folder listings are reused within a CLI run for this long
+FOLDER_LIST_TTL = 120
+
+# parent folder ID -> (fetched at, raw folder list, lowercased display name -> folder ID).
+# Names missing from the map are cached misses, so repeat lookups of a folder that
+# doesn't exist yet don't list the parent again.
+_FOLDER_LIST_CACHE: Dict[str, Tuple[float, List[Dict], Dict[str, str]]] = {}
+
+
+def _cached_listing(parent_folder_id: str) -> Tuple[List[Dict], Dict[str, str]]:
+    """
+    List folders directly under a parent, reusing a recent listing.
+
+    Uses the Resource Manager API when credentials are available and
+    gcloud otherwise.
+
+    Returns:
+        (raw folder list, lowercased display name -> folder ID)
+
+    Raises:
+        subprocess.CalledProcessError if the gcloud fallback fails
+    """
+    cached = _FOLDER_LIST_CACHE.get(parent_folder_id)
+    if cached and time.time() - cached[0] < FOLDER_LIST_TTL:
+        return cached[1], cached[2]
+
+    folders = _list_folders_rest(parent_folder_id)
+    if folders is None:
+        folders = _list_folders_gcloud(parent_folder_id)
+
+    ids_by_name = {}
+    for folder in folders:
+        # Folder name format: folders/123456789 (first match wins, as before)
+        full_name = folder.get('name', '')
+        if '/' in full_name:
+            ids_by_name.setdefault(folder.get('displayName', '').lower(), full_name.split('/')[1])
+
+    _FOLDER_LIST_CACHE[parent_folder_id] = (time.time(), folders, ids_by_name)
+    return folders, ids_by_name
+
+
+def _list_folders_rest(parent_folder_id: str) -> Optional[List[Dict]]:
+    """List folders through the Resource Manager API (None if that isn't possible)"""
+    session = authorized_session()
+    if session is None:
+        return None
+
+    folders = []
+    params = {'parent': f'folders/{parent_folder_id}'}
+    try:
+        while True:
+            response = session.get(f'{RESOURCE_MANAGER_URL}/v3/folders', params=params, timeout=30)
+            response.raise_for_status()
+            page = fastjson.loads(response.content)
+            folders.extend(page.get('folders', []))
+            if not page.get('nextPageToken'):
+                return folders
+            params['pageToken'] = page['nextPageToken']
+    except Exception:
+        return None
+
+
+def _list_folders_gcloud(parent_folder_id: str) -> List[Dict]:
+    """List folders with gcloud"""
+    result = subprocess.run(
+        [
+            'gcloud', 'resource-manager', 'folders', 'list',
+            f'--folder={parent_folder_id}',
+            '--format=json(name,displayName)',
+            '--verbosity=error'
+        ],
+        capture_output=True,  # Bytes: the JSON parser decodes them itself
+        check=True,
+        timeout=30
+    )
+
+    return fastjson.loads(result.stdout) if result.stdout else []
+
+
+def _project_parent(project_id: str) -> Dict:
+    """Parent of a project as {'type': ..., 'id': ...} ({} if it can't be read)"""
+    session = authorized_session()
+    if session is not None:
+        try:
+            response = session.get(f'{RESOURCE_MANAGER_URL}/v1/projects/{project_id}', timeout=30)
+            response.raise_for_status()
+            return fastjson.loads(response.content).get('parent', {})
+        except Exception:
+            pass
+
+    result = subprocess.run(
+        [
+            'gcloud', 'projects', 'describe', project_id,
+            '--format=json(parent)',  # Only the parent is compared
+            '--verbosity=error'
+        ],
+        capture_output=True,  # Bytes: the JSON parser decodes them itself
+        check=False,
+        timeout=30
+    )
+
+    if result.returncode != 0:
+        return {}
+    return fastjson.loads(result.stdout).get('parent', {})
+
 
 def find_folder_by_name(folder_name: str, parent_folder_id: str) -> Optional[str]:
     """
@@ -22,34 +131,12 @@ def find_folder_by_name(folder_name: str, parent_folder_id: str) -> Optional[str
         Folder ID if found, None otherwise
     """
     try:
-        result = subprocess.run(
-            [
-                'gcloud', 'resource-manager', 'folders', 'list',
-                f'--folder={parent_folder_id}',
-                '--format=json',
-                '--verbosity=error'
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=30
-        )
-
-        if result.returncode != 0:
-            return None
-
-        folders = json.loads(result.stdout) if result.stdout else []
-
         # Search for matching folder (case-insensitive)
-        for folder in folders:
-            if folder.get('displayName', '').lower() == folder_name.lower():
-                # Extract folder ID from name (format: folders/123456789)
-                folder_full_name = folder.get('name', '')
-                if '/' in folder_full_name:
-                    return folder_full_name.split('/')[1]
+        _, ids_by_name = _cached_listing(parent_folder_id)
+        return ids_by_name.get(folder_name.lower())
 
+    except subprocess.CalledProcessError:
         return None
-
     except Exception as e:
         console.print(f"[yellow]⚠ Error searching for folder: {e}[/yellow]")
         return None
@@ -83,9 +170,12 @@ def create_folder(folder_name: str, parent_folder_id: str) -> Optional[str]:
         )
 
         # Parse response to get folder ID
-        folder_data = json.loads(result.stdout)
+        folder_data = fastjson.loads(result.stdout)
         folder_full_name = folder_data.get('name', '')
 
+        # The parent's cached listing no longer includes every folder
+        _FOLDER_LIST_CACHE.pop(parent_folder_id, None)
+
         if '/' in folder_full_name:
             folder_id = folder_full_name.split('/')[1]
             console.print(f"[green]✓ Folder created: {folder_id}[/green]")
@@ -157,26 +247,12 @@ def move_project_to_folder(project_id: str, folder_id: str) -> bool:
     """
     try:
         # Check current parent
-        result = subprocess.run(
-            [
-                'gcloud', 'projects', 'describe', project_id,
-                '--format=json',
-                '--verbosity=error'
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-            timeout=30
-        )
-
-        if result.returncode == 0:
-            project_data = json.loads(result.stdout)
-            current_parent = project_data.get('parent', {})
+        current_parent = _project_parent(project_id)
 
-            # Check if already in target folder
-            if current_parent.get('type') == 'folder' and current_parent.get('id') == folder_id:
-                console.print(f"[dim]Project already in folder {folder_id}[/dim]")
-                return True
+        # Check if already in target folder
+        if current_parent.get('type') == 'folder' and current_parent.get('id') == folder_id:
+            console.print(f"[dim]Project already in folder {folder_id}[/dim]")
+            return True
 
         # Move project to folder (requires beta command)
         console.print(f"[cyan]Moving project to folder...[/cyan]")
@@ -216,20 +292,7 @@ def list_client_folders(parent_folder_id: str) -> list:
         List of dicts with folder info (id, name)
     """
     try:
-        result = subprocess.run(
-            [
-                'gcloud', 'resource-manager', 'folders', 'list',
-                f'--folder={parent_folder_id}',
-                '--format=json',
-                '--verbosity=error'
-            ],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=30
-        )
-
-        folders = json.loads(result.stdout) if result.stdout else []
+        folders, _ = _cached_listing(parent_folder_id)
 
         return [
             {
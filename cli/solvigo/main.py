@@ -1,23 +1,31 @@
 """
 Main entry point for the Solvigo CLI
 """
+import os
 import sys
 import click
 from rich.console import Console
-from rich.panel import Panel
 
-from solvigo.commands.interactive import interactive_mode
-from solvigo.utils.context import detect_project_context
 from solvigo import __version__
 
 console = Console()
 
+# gcloud properties applied to every gcloud subprocess this CLI starts. Set through
+# the environment (not `gcloud config set`) so the user's own config is untouched.
+GCLOUD_ENV_DEFAULTS = {
+    # Answer prompts with their default instead of hanging until the timeout
+    'CLOUDSDK_CORE_DISABLE_PROMPTS': '1',
+    # Skip the usage-reporting request gcloud makes after each command
+    'CLOUDSDK_CORE_DISABLE_USAGE_REPORTING': 'true',
+}
+
 
 @click.group(invoke_without_command=True)
 @click.version_option(version=__version__)
 @click.option('--dev', is_flag=True, help='Run in development mode (connect to local Admin API)')
+@click.option('--no-cache', is_flag=True, help='Ignore cached GCP lookups and fetch fresh data')
 @click.pass_context
-def cli(ctx, dev):
+def cli(ctx, dev, no_cache):
     """
     Solvigo CLI - Interactive tool for managing client projects on GCP
 
@@ -26,6 +34,13 @@ def cli(ctx, dev):
     ctx.ensure_object(dict)
     ctx.obj['dev'] = dev
 
+    for name, value in GCLOUD_ENV_DEFAULTS.items():
+        os.environ.setdefault(name, value)
+
+    if no_cache:
+        from solvigo.gcp._cache import refresh
+        refresh()
+
     if ctx.invoked_subcommand is None:
         # No subcommand provided - run interactive mode
         run_interactive(ctx)
@@ -33,6 +48,11 @@ def cli(ctx, dev):
 
 def run_interactive(ctx=None):
     """Run the interactive CLI mode"""
+    # Imported here so subcommands and --version don't load the interactive UI
+    from rich.panel import Panel
+    from solvigo.commands.interactive import interactive_mode
+    from solvigo.utils.context import detect_project_context
+
     try:
         # Welcome banner
         console.print()
@@ -149,6 +169,7 @@ def deploy(env):
         solvigo deploy --env prod
     """
     from solvigo.commands.deploy import deploy_infrastructure
+    from solvigo.utils.context import detect_project_context
     from pathlib import Path
 
     context = detect_project_context()
@@ -172,6 +193,7 @@ def status():
         solvigo status
     """
     from solvigo.commands.status import show_status
+    from solvigo.utils.context import detect_project_context
 
     context = detect_project_context()
     if not context['exists']:
@@ -181,5 +203,24 @@ def status():
     show_status(context)
 
 
+@cli.group()
+def cache():
+    """Manage cached GCP and Admin API lookups"""
+
+
+@cache.command('clear')
+def cache_clear():
+    """
+    Remove cached lookups so the next run fetches fresh data
+
+    Example:
+        solvigo cache clear
+    """
+    from solvigo.gcp._cache import clear
+
+    removed = clear()
+    console.print(f"[green]✓[/green] Cleared {removed} cache file(s)")
+
+
 if __name__ == '__main__':
     cli()
@@ -3,12 +3,31 @@ CLI Authentication service
 
 Handles authentication for CLI operations using gcloud.
 """
+import os
 import subprocess
 from typing import Optional
 from rich.console import Console
 
+from solvigo.gcp._cache import cached
+
 console = Console()
 
+# The active gcloud account is reused across CLI runs for this long
+GCLOUD_AUTH_TTL = 300
+
+
+@cached(ttl=GCLOUD_AUTH_TTL)
+def _active_gcloud_account() -> str:
+    """Active account from `gcloud auth list` ('' if nobody is logged in; not cached)"""
+    result = subprocess.run(
+        ['gcloud', 'auth', 'list', '--filter=status:ACTIVE', '--format=value(account)'],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=10
+    )
+    return result.stdout.strip()
+
 
 class CLIAuthService:
     """Service for CLI authentication."""
@@ -22,14 +41,7 @@ class CLIAuthService:
             True if authenticated, False otherwise
         """
         try:
-            result = subprocess.run(
-                ['gcloud', 'auth', 'list', '--filter=status:ACTIVE', '--format=value(account)'],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=10
-            )
-            return bool(result.stdout.strip())
+            return bool(_active_gcloud_account())
         except Exception:
             return False
 
@@ -44,14 +56,7 @@ class CLIAuthService:
         Raises:
             Exception if no active auth
         """
-        result = subprocess.run(
-            ['gcloud', 'auth', 'list', '--filter=status:ACTIVE', '--format=value(account)'],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=10
-        )
-        return result.stdout.strip()
+        return _active_gcloud_account()
 
     @staticmethod
     def prompt_login():
@@ -60,7 +65,9 @@ class CLIAuthService:
         console.print("Please login to continue:\n")
 
         try:
-            subprocess.run(['gcloud', 'auth', 'login'], check=True)
+            # Login is interactive, so it must not inherit the CLI's prompt suppression
+            env = {k: v for k, v in os.environ.items() if k != 'CLOUDSDK_CORE_DISABLE_PROMPTS'}
+            subprocess.run(['gcloud', 'auth', 'login'], check=True, env=env)
             console.print("[green]✓ Authentication successful![/green]\n")
         except subprocess.CalledProcessError:
             console.print("[red]✗ Authentication failed.[/red]")
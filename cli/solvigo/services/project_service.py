@@ -82,7 +82,7 @@ class ProjectLookupService:
 
     def _map_to_entity(self, api_response: dict) -> ProjectInfo:
         """Map API response to domain entity"""
-        environments = [
+        environments = tuple(
             Environment(
                 name=env['name'],
                 database_instance=env.get('database_instance'),
@@ -90,9 +90,9 @@ class ProjectLookupService:
                 requires_approval=env.get('requires_approval', True)
             )
             for env in api_response.get('environments', [])
-        ]
+        )
 
-        services = [
+        services = tuple(
             Service(
                 name=svc['name'],
                 type=svc['type'],
@@ -102,7 +102,7 @@ class ProjectLookupService:
                 last_deployed_at=svc.get('last_deployed_at')
             )
             for svc in api_response.get('services', [])
-        ]
+        )
 
         return ProjectInfo(
             id=api_response['id'],
@@ -3,9 +3,10 @@ CI/CD Terraform configuration generator
 """
 from pathlib import Path
 from typing import Dict, List
-from jinja2 import Template
 from rich.console import Console
 
+from solvigo.terraform.templates import compile_template
+
 console = Console()
 
 
@@ -78,7 +79,7 @@ def generate_cicd_tf(
         True if successful, False otherwise
     """
     try:
-        template = Template("""# CI/CD Pipeline Setup
+        template = compile_template("""# CI/CD Pipeline Setup
 # Generated by Solvigo CLI
 
 # Get platform GitHub connection
@@ -174,7 +175,7 @@ def generate_cloudbuild_yaml(
         # Extract directory path from Dockerfile path
         dockerfile_dir = str(Path(dockerfile_path).parent) if Path(dockerfile_path).parent != Path('.') else '.'
 
-        template = Template("""# Cloud Build Configuration for {{ client }}/{{ project }} - {{ service_name }}
+        template = compile_template("""# Cloud Build Configuration for {{ client }}/{{ project }} - {{ service_name }}
 # Generated by Solvigo CLI
 #
 # This file defines the CI/CD pipeline for deploying your application.
@@ -351,7 +352,7 @@ def generate_orchestrator_cloudbuild(
         with open(template_path, 'r') as f:
             template_content = f.read()
 
-        template = Template(template_content)
+        template = compile_template(template_content)
 
         # Organize services by type
         backend_service = next((s for s in services if s['type'] == 'backend'), None)
@@ -3,10 +3,10 @@ Terraform code generator - creates Terraform configurations from selected resour
 """
 from pathlib import Path
 from typing import Dict, List
-from jinja2 import Template
 from rich.console import Console
 import shutil
 
+from solvigo.terraform.templates import compile_template
 from solvigo.utils.bootstrap import PLATFORM_PROJECT_NUMBER
 
 console = Console()
@@ -338,6 +338,80 @@ def generate_terraform_config(
         return False
 
 
+def generate_all_tf(
+    client: str,
+    project: str,
+    selected_resources: Dict[str, List],
+    output_dir: Path,
+    gcp_project_id: str,
+    append: bool = False,
+    client_subdomain: str = None,
+    project_subdomain: str = None
+) -> List[str]:
+    """
+    Generate the per-resource Terraform files for the selected resources in one pass.
+
+    Only resource types present in selected_resources are written; imports.tf
+    is always regenerated.
+
+    Args:
+        client: Client name
+        project: Project name
+        selected_resources: Dict of selected resources
+        output_dir: Terraform directory
+        gcp_project_id: GCP project ID (for import blocks)
+        append: Whether to add to existing files instead of overwriting
+        client_subdomain: Client subdomain from database (for SA naming)
+        project_subdomain: Project subdomain from database (for SA naming)
+
+    Returns:
+        Names of the files that were written
+    """
+    has_database = bool(selected_resources.get('cloud_sql') or selected_resources.get('firestore'))
+    written = []
+
+    if selected_resources.get('cloud_run'):
+        generate_cloud_run_tf(
+            client, project, selected_resources['cloud_run'], output_dir,
+            append=append,
+            has_database=has_database,
+            client_subdomain=client_subdomain,
+            project_subdomain=project_subdomain
+        )
+        written.append('cloud-run.tf')
+
+    if selected_resources.get('cloud_sql'):
+        generate_cloud_sql_tf(
+            client, project, selected_resources['cloud_sql'], output_dir,
+            append=append,
+            client_subdomain=client_subdomain,
+            project_subdomain=project_subdomain
+        )
+        written.append('database-sql.tf')
+
+    if selected_resources.get('storage'):
+        generate_storage_tf(client, project, selected_resources['storage'], output_dir, append=append)
+        written.append('storage.tf')
+
+    if selected_resources.get('secrets'):
+        generate_secrets_tf(client, project, selected_resources['secrets'], output_dir, append=append)
+        written.append('secrets.tf')
+
+    if selected_resources.get('service_accounts'):
+        generate_service_accounts_tf(
+            client, project, selected_resources['service_accounts'], output_dir,
+            append=append,
+            client_subdomain=client_subdomain,
+            project_subdomain=project_subdomain
+        )
+        written.append('service-accounts.tf')
+
+    generate_imports_tf(client, project, selected_resources, output_dir, gcp_project_id, append=append)
+    written.append('imports.tf')
+
+    return written
+
+
 def generate_backend_tf(client: str, project: str, output_dir: Path,
                        client_subdomain: str = None, project_subdomain: str = None):
     """Generate backend.tf for remote state"""
@@ -349,7 +423,7 @@ def generate_backend_tf(client: str, project: str, output_dir: Path,
         project_slug = project.lower().replace(' ', '-')
         bucket_name = f"{client_slug}-{project_slug}-tfstate"
 
-    template = Template("""terraform {
+    template = compile_template("""terraform {
   backend "gcs" {
     bucket = "{{ bucket_name }}"
   }
@@ -376,7 +450,7 @@ def generate_deployer_sa_tf(output_dir: Path):
     Note: This SA is created via CLI bootstrap (gcloud commands) before terraform runs.
     Terraform will import and manage it going forward.
     """
-    template = Template("""# Deployer Service Account
+    template = compile_template("""# Deployer Service Account
 # Created via CLI bootstrap, managed by Terraform going forward
 resource "google_service_account" "deployer" {
   account_id   = "deployer"
@@ -428,7 +502,7 @@ def generate_variables_tf(client: str, project: str, gcp_project_id: str, output
     client_label = sanitize_label_value(client)
     project_label = sanitize_label_value(project)
 
-    template = Template("""variable "project_id" {
+    template = compile_template("""variable "project_id" {
   description = "GCP Project ID"
   type        = string
   default     = "{{ project_id }}"
@@ -496,7 +570,7 @@ variable "shared_vpc_name" {
 
 def generate_main_tf(client: str, project: str, output_dir: Path):
     """Generate main.tf with provider configuration"""
-    template = Template("""# {{ client }} / {{ project }}
+    template = compile_template("""# {{ client }} / {{ project }}
 # Generated by Solvigo CLI
 
 provider "google" {
@@ -534,7 +608,7 @@ def generate_apis_tf(
     if 'apis' in selected_resources and selected_resources['apis']:
         apis.extend(selected_resources['apis'])
 
-    template = Template("""# Enable required GCP APIs
+    template = compile_template("""# Enable required GCP APIs
 
 resource "google_project_service" "required_apis" {
   for_each = toset([
@@ -572,6 +646,7 @@ def generate_cloud_run_tf(client: str, project: str, services: List[Dict], outpu
     if append and file_path.exists():
         # Append mode - add new services without overwriting
         existing_content = file_path.read_text()
+        new_modules = []
 
         for service in services:
             service_name = service['name']
@@ -582,15 +657,16 @@ def generate_cloud_run_tf(client: str, project: str, services: List[Dict], outpu
                 console.print(f"  [dim]{service_name} already exists (skipping)[/dim]")
                 continue
 
-            # Generate and append
+            # Generate module code
             if service.get('_create'):
-                module_code = generate_cloud_run_module(client, project, service, sa_prefix, has_database)
+                new_modules.append(generate_cloud_run_module(client, project, service, sa_prefix, has_database))
             else:
-                module_code = generate_cloud_run_import_module(client, project, service, sa_prefix, has_database)
+                new_modules.append(generate_cloud_run_import_module(client, project, service, sa_prefix, has_database))
 
+        # Append all new modules with a single write
+        if new_modules:
             with open(file_path, 'a') as f:
-                f.write("\n\n")
-                f.write(module_code)
+                f.write(''.join(f"\n\n{module_code}" for module_code in new_modules))
     else:
         # Normal mode - generate full file
         lines = ["# Cloud Run Services\n"]
@@ -630,7 +706,7 @@ def generate_cloud_run_module(client: str, project: str, service: Dict, sa_prefi
   service_account_email = local.{sa_resource_name}_email
 """
 
-    template = Template("""
+    template = compile_template("""
 # {{ service_name }} ({{ service_type }})
 # Note: Initial deployment uses placeholder image (gcr.io/cloudrun/hello)
 # Your CI/CD pipeline will deploy the real application image
@@ -695,7 +771,7 @@ def generate_cloud_sql_module(client: str, project: str, db: Dict, sa_prefix: st
     backend_sa_name = f"{sa_prefix}-backend-app"
     backend_sa_resource = backend_sa_name.replace('-', '_')
 
-    template = Template("""
+    template = compile_template("""
 # Cloud SQL: {{ db_name }}
 module "{{ module_name }}" {
   source = "./modules/database-cloudsql"
@@ -756,7 +832,7 @@ def generate_migration_job_tf(
 
     job_name = f"{sa_prefix}-db-migrations"
 
-    template = Template("""# Database Migration Job
+    template = compile_template("""# Database Migration Job
 
 module "db_migrations" {
   source = "./modules/cloud-run-migration-job"
@@ -813,7 +889,7 @@ def generate_firestore_tf(client: str, project: str, databases: List[Dict], outp
 
 def generate_firestore_module(client: str, project: str, db: Dict) -> str:
     """Generate Firestore database configuration"""
-    template = Template("""
+    template = compile_template("""
 # Firestore Database
 module "firestore" {
   source = "./modules/database-firestore"
@@ -857,7 +933,7 @@ def generate_storage_module(client: str, project: str, bucket: Dict) -> str:
     # Sanitize module name (handles names starting with numbers)
     module_name = sanitize_terraform_name(bucket_name, 'bucket')
 
-    template = Template("""
+    template = compile_template("""
 # Storage: {{ bucket_name }}
 module "{{ module_name }}" {
   source = "./modules/storage-bucket"
@@ -1077,7 +1153,7 @@ def generate_vpc_tf(client: str, project: str, output_dir: Path):
     References the shared VPC from the host project that this service project
     is attached to.
     """
-    template = Template("""# Shared VPC Configuration
+    template = compile_template("""# Shared VPC Configuration
 # This project is attached as a service project to the platform's shared VPC
 
 # Data source to reference shared VPC from host project
@@ -1104,7 +1180,7 @@ def generate_vpc_connector_tf(client: str, project: str, output_dir: Path):
     # Use the shared VPC connector per region
     # Format: solvigo-vpc-connector-{region_suffix}
     # europe-north2 -> north2, europe-north1 -> north1
-    template = Template("""# VPC Access Connector for Cloud Run to Cloud SQL
+    template = compile_template("""# VPC Access Connector for Cloud Run to Cloud SQL
 # Required for Cloud Run to connect to Cloud SQL private IP
 #
 # NOTE: For Shared VPC, the VPC connector is created in the HOST project
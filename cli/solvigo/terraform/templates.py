@@ -0,0 +1,27 @@
+"""
+Shared Jinja environment for Terraform and CI/CD generation
+"""
+import functools
+
+from jinja2 import Environment, Template
+
+# One environment for every generator, with the same defaults as jinja2.Template
+_environment = Environment(auto_reload=False, cache_size=-1)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_template(source: str) -> Template:
+    """
+    Compile a template once per CLI run.
+
+    The generators build their templates from constant strings, so repeated
+    generation (several environments, services or runs in one session)
+    reuses the compiled template instead of parsing it again.
+
+    Args:
+        source: Template source
+
+    Returns:
+        Compiled template
+    """
+    return _environment.from_string(source)
@@ -1,6 +1,7 @@
 """
 CI/CD setup prompts for Cloud Build integration
 """
+import functools
 import os
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -11,6 +12,9 @@ from questionary import Choice
 
 console = Console()
 
+# GitHub connection per dev_mode, remembered once found for the rest of the CLI run
+_github_connection_ids: Dict[bool, str] = {}
+
 
 def prompt_cicd_setup() -> bool:
     """
@@ -434,9 +438,10 @@ def confirm_cicd_setup() -> bool:
     return result if result is not None else False
 
 
+@functools.lru_cache(maxsize=None)
 def get_platform_project_id() -> str:
     """
-    Get platform project ID from environment or config.
+    Get platform project ID from environment or config (resolved once per CLI run).
 
     Returns:
         Platform project ID
@@ -462,28 +467,34 @@ def get_platform_project_id() -> str:
     return "solvigo-platform-prod"
 
 
-def get_github_connection_id(dev_mode: bool = False) -> Optional[str]:
+def get_github_connection_id(dev_mode: bool = False, platform_config: Optional[Dict] = None) -> Optional[str]:
     """
     Get GitHub connection ID from Admin API.
 
     Args:
         dev_mode: Whether running in dev mode
+        platform_config: Already-fetched platform configuration (optional)
 
     Returns:
         GitHub connection resource name or None
     """
-    from solvigo.admin.client import AdminClient
+    from solvigo.admin.client import get_admin_client
+
+    if platform_config is None and dev_mode in _github_connection_ids:
+        return _github_connection_ids[dev_mode]
 
     try:
-        admin_client = AdminClient(dev_mode=dev_mode)
+        if platform_config is None:
+            admin_client = get_admin_client(dev_mode)
 
-        # Call Admin API to get platform configuration
-        platform_config = admin_client.get_platform_config()
+            # Call Admin API to get platform configuration
+            platform_config = admin_client.get_platform_config()
 
         # Extract GitHub connection from config
         github_connection = platform_config.get('github_connection')
 
         if github_connection:
+            _github_connection_ids[dev_mode] = github_connection
             return github_connection
         else:
             console.print("\n[yellow]⚠ GitHub connection not configured in platform[/yellow]")
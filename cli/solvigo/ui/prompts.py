@@ -2,8 +2,9 @@
 Interactive prompts using questionary
 """
 import questionary
-from questionary import Style
-from typing import List, Dict, Optional
+from enum import Enum
+from questionary import Choice, Style
+from typing import Any, List, Dict, Optional, Tuple, Union
 from rich.console import Console
 
 console = Console()
@@ -21,7 +22,19 @@ solvigo_style = Style([
 ])
 
 
-def main_menu(project_detected: bool = False, client: str = None, project: str = None, has_terraform: bool = False) -> str:
+class MainMenuAction(Enum):
+    """Actions offered by the interactive main menu"""
+    GENERATE = "generate"
+    DEPLOY = "deploy"
+    DELETE = "delete"
+    CREATE = "create"
+    CHOOSE = "choose"
+    IMPORT = "import"
+    EXIT = "exit"
+
+
+def main_menu(project_detected: bool = False, client: str = None, project: str = None,
+              has_terraform: bool = False) -> MainMenuAction:
     """
     Display main menu and get user choice.
 
@@ -32,42 +45,39 @@ def main_menu(project_detected: bool = False, client: str = None, project: str =
         has_terraform: Whether terraform directory exists
 
     Returns:
-        User's choice
+        MainMenuAction for the selected entry (EXIT if the prompt was cancelled)
     """
     if project_detected:
-        choices = []
-
-        # Only show "Generate Infrastructure" if terraform doesn't exist
-        if not has_terraform:
-            choices.append('⚙️ Generate infrastructure')
-
-        # Always show deploy if terraform exists
+        # Offer generation until terraform exists, then deploy
         if has_terraform:
-            choices.append('🚀 Deploy infrastructure')
+            menu_items = [('🚀 Deploy infrastructure', MainMenuAction.DEPLOY)]
+        else:
+            menu_items = [('⚙️ Generate infrastructure', MainMenuAction.GENERATE)]
 
         # Common options
-        choices.extend([
-            '🗑️ Delete from registry',
-            '❌ Exit'
+        menu_items.extend([
+            ('🗑️ Delete from registry', MainMenuAction.DELETE),
+            ('❌ Exit', MainMenuAction.EXIT)
         ])
 
         message = f"What would you like to do with {client}/{project}?"
     else:
-        choices = [
-            '🆕 Create new project',
-            '📁 Choose existing project',
-            '📥 Import existing GCP project',
-            '🔧 Setup new client',
-            '❌ Exit'
+        menu_items = [
+            ('🆕 Create new project', MainMenuAction.CREATE),
+            ('📁 Choose existing project', MainMenuAction.CHOOSE),
+            ('📥 Import existing GCP project', MainMenuAction.IMPORT),
+            ('❌ Exit', MainMenuAction.EXIT)
         ]
         message = "What would you like to do?"
 
-    return questionary.select(
+    result = questionary.select(
         message,
-        choices=choices,
+        choices=[Choice(label, value=action) for label, action in menu_items],
         style=solvigo_style
     ).ask()
 
+    return result or MainMenuAction.EXIT
+
 
 def select_cloud_run_services(services: List[Dict], client: str = None, project: str = None) -> List[Dict]:
     """
@@ -698,45 +708,56 @@ def create_new_cloud_run_prompt(client: str, project: str) -> Optional[Dict]:
     }
 
 
-def select_option(message: str, choices: List[str], default: Optional[str] = None) -> str:
+def select_option(message: str, choices: List[Union[str, Tuple[str, Any]]], default: Optional[str] = None) -> Any:
     """
     Let user select one option from a list using arrow keys.
 
     Args:
         message: Question to display
-        choices: List of options
-        default: Default selection (optional)
+        choices: List of options, either labels or (label, value) pairs
+        default: Default selection label (optional)
 
     Returns:
-        Selected option
+        Selected label, or the value paired with it when pairs were given
+        (None if the prompt was cancelled)
 
     Usage:
         - Use arrow keys (↑/↓) to navigate
         - Press Enter to select
         - Type to search (for long lists)
     """
+    # Pairs let callers get structured data back without parsing the label
+    values = None
+    if choices and isinstance(choices[0], tuple):
+        values = dict(choices)
+        choices = list(values)
+
     # For very long lists, use autocomplete (searchable)
     if len(choices) > 36:
         # Add search instruction to message
         search_message = f"{message} (Type to search, use arrow keys)"
-        return questionary.autocomplete(
+        answer = questionary.autocomplete(
             search_message,
             choices=choices,
             default=default or "",
             style=solvigo_style
         ).ask()
-
-    # For shorter lists, use select with arrow keys
-    if len(choices) > 1:
-        arrow_message = f"{message} (Use arrow keys)"
     else:
-        arrow_message = message
+        # For shorter lists, use select with arrow keys
+        if len(choices) > 1:
+            arrow_message = f"{message} (Use arrow keys)"
+        else:
+            arrow_message = message
 
-    return questionary.select(
-        arrow_message,
-        choices=choices,
-        default=default,
-        style=solvigo_style,
-        use_shortcuts=False,  # Disable shortcuts to support more than 36 items
-        use_arrow_keys=True
-    ).ask()
+        answer = questionary.select(
+            arrow_message,
+            choices=choices,
+            default=default,
+            style=solvigo_style,
+            use_shortcuts=False,  # Disable shortcuts to support more than 36 items
+            use_arrow_keys=True
+        ).ask()
+
+    if values is None:
+        return answer
+    return values.get(answer)
@@ -0,0 +1,7 @@
+"""
+Location of the CLI's on-disk caches, shared by the Admin API client and GCP lookups
+"""
+import os
+from pathlib import Path
+
+CACHE_DIR = Path(os.getenv('SOLVIGO_CACHE_DIR', Path.home() / '.cache' / 'solvigo'))
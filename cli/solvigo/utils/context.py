@@ -6,6 +6,9 @@ from pathlib import Path
 import re
 from typing import Dict, Optional
 
+# Existence of paths checked by the interactive menu, keyed by absolute path
+_stat_cache: Dict[str, bool] = {}
+
 
 def detect_project_context(dev_mode: bool = False) -> Dict[str, any]:
     """
@@ -45,9 +48,9 @@ def detect_project_context(dev_mode: bool = False) -> Dict[str, any]:
 
     # Query API for project with this GitHub URL
     try:
-        from solvigo.admin.client import AdminClient
+        from solvigo.admin.client import get_admin_client
 
-        client = AdminClient(dev_mode=dev_mode)
+        client = get_admin_client(dev_mode)
         projects = client.list_projects(github_repo=github_url)
 
         if not projects:
@@ -236,3 +239,27 @@ def list_all_clients() -> list[str]:
         for d in clients_dir.iterdir()
         if d.is_dir() and not d.name.startswith('.')
     ]
+
+
+def exists_cached(path: Path) -> bool:
+    """
+    Check whether a path exists, hitting the filesystem once per path per run.
+
+    Call forget_cached_path() after creating or removing the path.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        True if the path exists
+    """
+    key = os.path.abspath(path)
+    exists = _stat_cache.get(key)
+    if exists is None:
+        exists = _stat_cache[key] = os.path.exists(key)
+    return exists
+
+
+def forget_cached_path(path: Path):
+    """Drop a path from the exists_cached() cache so the next check stats it again"""
+    _stat_cache.pop(os.path.abspath(path), None)
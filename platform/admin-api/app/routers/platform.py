@@ -2,6 +2,7 @@
 Platform operations endpoints - handles cross-project resources
 managed in the platform project (solvigo-platform-prod)
 """
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List, Dict, Optional
@@ -639,7 +640,6 @@ def create_build_triggers(
 
     # Deployer SA now lives in client project (not platform project)
     deployer_email = f"deployer@{project.gcp_project_id}.iam.gserviceaccount.com"
-    triggers_created = []
 
     try:
         # Get credentials explicitly (uses impersonation in dev mode)
@@ -682,12 +682,11 @@ def create_build_triggers(
                 detail=f"Failed to find repository in connection: {str(e)}"
             )
 
-        # Create one trigger per environment (orchestrator pattern)
+        # Build one trigger per environment (orchestrator pattern)
+        env_triggers = []
         for env in trigger_config.environments:
             trigger_name = f"{project_id}-{env.name}"
 
-            logger.info(f"Creating Cloud Build trigger: {trigger_name}")
-
             # Determine trigger source (branch or tag)
             if env.branch_pattern:
                 # Use push event with branch filter
@@ -727,108 +726,115 @@ def create_build_triggers(
                 service_account=f"projects/{project.gcp_project_id}/serviceAccounts/{deployer_email}"
                 # No approval_config - rely on GitHub branch protection instead
             )
+            env_triggers.append((env, trigger))
 
-            # ==================== DIAGNOSTIC LOGGING START ====================
-            logger.info("=== PERMISSION DIAGNOSTIC START ===")
+        # Diagnostics don't depend on the environment, so run them once for all triggers
+        # ==================== DIAGNOSTIC LOGGING START ====================
+        logger.info("=== PERMISSION DIAGNOSTIC START ===")
 
-            # Phase 1: Log the authenticated identity being used
-            logger.info(f"Authenticated as: {credentials.service_account_email if hasattr(credentials, 'service_account_email') else 'unknown'}")
-            logger.info(f"Credential type: {type(credentials).__name__}")
+        # Phase 1: Log the authenticated identity being used
+        logger.info(f"Authenticated as: {credentials.service_account_email if hasattr(credentials, 'service_account_email') else 'unknown'}")
+        logger.info(f"Credential type: {type(credentials).__name__}")
 
-            # Log what we're trying to do
-            logger.info(f"Creating trigger in project: {PLATFORM_PROJECT_ID}")
-            service_account_path = f"projects/{project.gcp_project_id}/serviceAccounts/{deployer_email}"
-            logger.info(f"Trigger will use service account: {service_account_path}")
-            logger.info(f"Client project: {project.gcp_project_id}")
-
-            # Phase 2: Test direct impersonation of the deployer SA
-            try:
-                from google.cloud.iam_credentials_v1 import IAMCredentialsClient
-                from google.cloud.iam_credentials_v1.types import GenerateAccessTokenRequest
+        # Log what we're trying to do
+        logger.info(f"Creating trigger in project: {PLATFORM_PROJECT_ID}")
+        service_account_path = f"projects/{project.gcp_project_id}/serviceAccounts/{deployer_email}"
+        logger.info(f"Trigger will use service account: {service_account_path}")
+        logger.info(f"Client project: {project.gcp_project_id}")
 
-                iam_creds_client = IAMCredentialsClient(credentials=credentials)
-
-                # Try to generate access token for the deployer SA (tests actAs permission)
-                service_account_name = f"projects/-/serviceAccounts/{deployer_email}"
+        # Phase 2: Test direct impersonation of the deployer SA
+        try:
+            from google.cloud.iam_credentials_v1 import IAMCredentialsClient
+            from google.cloud.iam_credentials_v1.types import GenerateAccessTokenRequest
 
-                logger.info(f"Testing impersonation of: {service_account_name}")
+            iam_creds_client = IAMCredentialsClient(credentials=credentials)
 
-                # Use generateAccessToken to test if we have actAs permission
-                request_iam = GenerateAccessTokenRequest(
-                    name=service_account_name,
-                    scope=["https://www.googleapis.com/auth/cloud-platform"],
-                )
+            # Try to generate access token for the deployer SA (tests actAs permission)
+            service_account_name = f"projects/-/serviceAccounts/{deployer_email}"
 
-                # This will fail with 403 if we don't have actAs permission
-                response_iam = iam_creds_client.generate_access_token(request=request_iam)
-                logger.info("✓ Successfully tested impersonation - actAs permission is working")
+            logger.info(f"Testing impersonation of: {service_account_name}")
 
-            except Exception as test_error:
-                logger.error(f"✗ Failed impersonation test: {test_error}")
-                logger.error(f"This indicates the permission issue is with: {credentials.service_account_email if hasattr(credentials, 'service_account_email') else 'the authenticated identity'}")
-
-            # Phase 3: Test permissions using IAM testPermissions API
-            try:
-                from google.cloud.iam_admin_v1.types import TestIamPermissionsRequest
-
-                iam_admin_client = iam_admin_v1.IAMClient(credentials=credentials)
-
-                # Test permissions on the deployer service account
-                resource_name = f"projects/{project.gcp_project_id}/serviceAccounts/{deployer_email}"
-                request_test = TestIamPermissionsRequest(
-                    resource=resource_name,
-                    permissions=[
-                        "iam.serviceAccounts.actAs",
-                        "iam.serviceAccounts.getAccessToken",
-                        "iam.serviceAccounts.implicitDelegation",
-                    ]
-                )
+            # Use generateAccessToken to test if we have actAs permission
+            request_iam = GenerateAccessTokenRequest(
+                name=service_account_name,
+                scope=["https://www.googleapis.com/auth/cloud-platform"],
+            )
 
-                response_test = iam_admin_client.test_iam_permissions(request=request_test)
-                logger.info(f"Permissions on deployer SA: {list(response_test.permissions)}")
+            # This will fail with 403 if we don't have actAs permission
+            response_iam = iam_creds_client.generate_access_token(request=request_iam)
+            logger.info("✓ Successfully tested impersonation - actAs permission is working")
 
-                if "iam.serviceAccounts.actAs" not in response_test.permissions:
-                    logger.error("MISSING: iam.serviceAccounts.actAs permission on deployer SA")
-                else:
-                    logger.info("✓ Has iam.serviceAccounts.actAs permission")
+        except Exception as test_error:
+            logger.error(f"✗ Failed impersonation test: {test_error}")
+            logger.error(f"This indicates the permission issue is with: {credentials.service_account_email if hasattr(credentials, 'service_account_email') else 'the authenticated identity'}")
 
-            except Exception as perm_error:
-                logger.error(f"Failed to test permissions: {perm_error}")
+        # Phase 3: Test permissions using IAM testPermissions API
+        try:
+            from google.cloud.iam_admin_v1.types import TestIamPermissionsRequest
+
+            iam_admin_client = iam_admin_v1.IAMClient(credentials=credentials)
+
+            # Test permissions on the deployer service account
+            resource_name = f"projects/{project.gcp_project_id}/serviceAccounts/{deployer_email}"
+            request_test = TestIamPermissionsRequest(
+                resource=resource_name,
+                permissions=[
+                    "iam.serviceAccounts.actAs",
+                    "iam.serviceAccounts.getAccessToken",
+                    "iam.serviceAccounts.implicitDelegation",
+                ]
+            )
 
-            # Phase 4: Check Cloud Build permissions
-            try:
-                # Check if registry-api can create triggers in platform project
-                from google.cloud import resourcemanager_v3
+            response_test = iam_admin_client.test_iam_permissions(request=request_test)
+            logger.info(f"Permissions on deployer SA: {list(response_test.permissions)}")
 
-                crm_client = resourcemanager_v3.ProjectsClient(credentials=credentials)
-                platform_project_obj = crm_client.get_project(name=f"projects/{PLATFORM_PROJECT_ID}")
+            if "iam.serviceAccounts.actAs" not in response_test.permissions:
+                logger.error("MISSING: iam.serviceAccounts.actAs permission on deployer SA")
+            else:
+                logger.info("✓ Has iam.serviceAccounts.actAs permission")
 
-                logger.info(f"Platform project state: {platform_project_obj.state.name}")
+        except Exception as perm_error:
+            logger.error(f"Failed to test permissions: {perm_error}")
 
-                # Test if we have the cloudbuild.builds.create permission in platform project
-                logger.info("Checking Cloud Build permissions in platform project...")
+        # Phase 4: Check Cloud Build permissions
+        try:
+            # Check if registry-api can create triggers in platform project
+            from google.cloud import resourcemanager_v3
 
-                # List existing triggers to test read permission
-                list_request = cloudbuild_v1.ListBuildTriggersRequest(
-                    parent=parent,
-                    project_id=PLATFORM_PROJECT_ID
-                )
-                triggers_list = build_client.list_build_triggers(request=list_request)
-                logger.info(f"✓ Can list triggers in platform project (found {len(list(triggers_list))} triggers)")
+            crm_client = resourcemanager_v3.ProjectsClient(credentials=credentials)
+            platform_project_obj = crm_client.get_project(name=f"projects/{PLATFORM_PROJECT_ID}")
 
-            except Exception as cb_error:
-                logger.error(f"Cloud Build permission issue: {cb_error}")
+            logger.info(f"Platform project state: {platform_project_obj.state.name}")
 
-            # Phase 5: Check for cross-project scenario
-            if project.gcp_project_id != PLATFORM_PROJECT_ID:
-                logger.info(f"CROSS-PROJECT scenario detected:")
-                logger.info(f"  Trigger location: {PLATFORM_PROJECT_ID}")
-                logger.info(f"  Service account location: {project.gcp_project_id}")
-                logger.info("Checking for organization policies that might block cross-project SA usage...")
-                logger.info("Consider checking organization policy: constraints/iam.allowedPolicyMemberDomains")
+            # Test if we have the cloudbuild.builds.create permission in platform project
+            logger.info("Checking Cloud Build permissions in platform project...")
 
-            logger.info("=== PERMISSION DIAGNOSTIC END ===")
-            # ==================== DIAGNOSTIC LOGGING END ====================
+            # List existing triggers to test read permission
+            list_request = cloudbuild_v1.ListBuildTriggersRequest(
+                parent=parent,
+                project_id=PLATFORM_PROJECT_ID
+            )
+            triggers_list = build_client.list_build_triggers(request=list_request)
+            logger.info(f"✓ Can list triggers in platform project (found {len(list(triggers_list))} triggers)")
+
+        except Exception as cb_error:
+            logger.error(f"Cloud Build permission issue: {cb_error}")
+
+        # Phase 5: Check for cross-project scenario
+        if project.gcp_project_id != PLATFORM_PROJECT_ID:
+            logger.info(f"CROSS-PROJECT scenario detected:")
+            logger.info(f"  Trigger location: {PLATFORM_PROJECT_ID}")
+            logger.info(f"  Service account location: {project.gcp_project_id}")
+            logger.info("Checking for organization policies that might block cross-project SA usage...")
+            logger.info("Consider checking organization policy: constraints/iam.allowedPolicyMemberDomains")
+
+        logger.info("=== PERMISSION DIAGNOSTIC END ===")
+        # ==================== DIAGNOSTIC LOGGING END ====================
+
+        def create_trigger(env, trigger) -> Optional[Dict]:
+            """Create one environment's trigger, or look up the existing one"""
+            trigger_name = trigger.name
+            logger.info(f"Creating Cloud Build trigger: {trigger_name}")
 
             try:
                 # Log trigger configuration for debugging
@@ -843,7 +849,7 @@ def create_build_triggers(
                 created_trigger = build_client.create_build_trigger(request=request)
                 logger.info(f"Created trigger: {created_trigger.name} (ID: {created_trigger.id})")
 
-                triggers_created.append({
+                return {
                     'environment': env.name,
                     'trigger_id': created_trigger.id,
                     'trigger_name': created_trigger.name,
@@ -851,7 +857,7 @@ def create_build_triggers(
                     'tag_pattern': env.tag_pattern,
                     'cloudbuild_file': 'cicd/cloudbuild.yaml',
                     'resource_name': created_trigger.resource_name
-                })
+                }
 
             except google_exceptions.AlreadyExists:
                 logger.info(f"Trigger already exists: {trigger_name}")
@@ -865,7 +871,7 @@ def create_build_triggers(
 
                     for existing in existing_triggers:
                         if existing.name == trigger_name:
-                            triggers_created.append({
+                            return {
                                 'environment': env.name,
                                 'trigger_id': existing.id,
                                 'trigger_name': existing.name,
@@ -874,15 +880,15 @@ def create_build_triggers(
                                 'cloudbuild_file': 'cicd/cloudbuild.yaml',
                                 'resource_name': existing.resource_name,
                                 'status': 'already_exists'
-                            })
-                            break
+                            }
                 except Exception as e:
                     logger.error(f"Failed to list existing triggers: {e}")
-                    triggers_created.append({
+                    return {
                         'environment': env.name,
                         'trigger_name': trigger_name,
                         'status': 'already_exists_unverified'
-                    })
+                    }
+                return None
 
             except Exception as e:
                 # Enhanced error logging for diagnostics
@@ -918,6 +924,11 @@ def create_build_triggers(
 
                 raise handle_gcp_error(e, f"Create trigger for {env.name}", trigger_name)
 
+        # Triggers are independent, so create them concurrently (results keep environment order)
+        with ThreadPoolExecutor(max_workers=max(len(env_triggers), 1)) as executor:
+            results = list(executor.map(lambda item: create_trigger(*item), env_triggers))
+        triggers_created = [result for result in results if result]
+
         # Log in audit trail
         db.add(models.AuditLog(
             user_email=current_user,
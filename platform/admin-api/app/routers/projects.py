@@ -27,6 +27,54 @@ def register_project(
     if existing:
         raise HTTPException(status_code=409, detail=f"Project {project.id} already exists")
 
+    db_project = _add_project(db, project, current_user)
+
+    db.commit()
+    db.refresh(db_project)
+
+    return db_project
+
+
+@router.post("/bulk", response_model=schemas.BulkRegistrationResponse)
+def register_bulk(
+    registration: schemas.BulkRegistration,
+    db: Session = Depends(get_db),
+    current_user: str = Depends(get_current_user)
+):
+    """
+    Register a client and one of its projects in a single transaction (called by CLI during import).
+
+    Both entities are upserted: existing ones are left untouched and reported
+    as 'exists', so a failed project insert never leaves an orphan client.
+    """
+    client = registration.client
+    project = registration.project
+    result = {'client': 'exists', 'project': 'exists', 'project_id': project.id}
+
+    if not db.query(models.Client).filter(models.Client.id == client.id).first():
+        db.add(models.Client(**client.dict(), created_by=current_user))
+        db.add(models.AuditLog(
+            user_email=current_user,
+            action='create_client',
+            entity_type='client',
+            entity_id=client.id,
+            new_value={'client': client.dict()}
+        ))
+        # Flush so the project's client_id foreign key resolves
+        db.flush()
+        result['client'] = 'created'
+
+    if not db.query(models.Project).filter(models.Project.id == project.id).first():
+        _add_project(db, project, current_user)
+        result['project'] = 'created'
+
+    db.commit()
+
+    return result
+
+
+def _add_project(db: Session, project: schemas.ProjectCreate, current_user: str) -> models.Project:
+    """Add a project with its environments, services and audit entry (caller commits)"""
     # Create project
     db_project = models.Project(
         **project.dict(exclude={'environments', 'services'}),
@@ -67,9 +115,6 @@ def register_project(
         new_value={'project': project.dict()}
     ))
 
-    db.commit()
-    db.refresh(db_project)
-
     return db_project
 
 
@@ -67,6 +67,18 @@ class ProjectDetail(ProjectResponse):
     services: List[Dict]
 
 
+class BulkRegistration(BaseModel):
+    """Client and project registered together in one transaction"""
+    client: ClientCreate
+    project: ProjectCreate
+
+
+class BulkRegistrationResponse(BaseModel):
+    client: str  # 'created' or 'exists'
+    project: str  # 'created' or 'exists'
+    project_id: str
+
+
 # Environment schemas
 class EnvironmentBase(BaseModel):
     project_id: str